@@ -7,7 +7,7 @@ Manages user login, session management, and access control.
 
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
-from models.user import User, Admin, EventOrganizer, Student, Visitor
+from models.user import User, Admin, Perm
 from controllers.user_controller import UserController
 
 class AuthController:
@@ -104,12 +104,14 @@ class AuthController:
         Returns:
             bool: True if user is authorized
         """
+        perms = user.PERMS
+        
         # Admins can manage all events
-        if isinstance(user, Admin):
+        if perms & Perm.MANAGE_ALL:
             return True
         
         # Event organizers can manage their own events
-        if isinstance(user, EventOrganizer):
+        if perms & Perm.MANAGE_OWN:
             if event_organizer_id is None or user.user_id == event_organizer_id:
                 return True
         
@@ -125,7 +127,7 @@ class AuthController:
         Returns:
             bool: True if user is authorized
         """
-        return isinstance(user, Admin)
+        return bool(user.PERMS & Perm.MANAGE_USERS)
     
     def authorize_system_reports(self, user: User) -> bool:
         """
@@ -137,7 +139,7 @@ class AuthController:
         Returns:
             bool: True if user is authorized
         """
-        return isinstance(user, Admin)
+        return bool(user.PERMS & Perm.REPORTS)
     
     def authorize_event_creation(self, user: User) -> bool:
         """
@@ -149,7 +151,7 @@ class AuthController:
         Returns:
             bool: True if user is authorized
         """
-        return isinstance(user, (Admin, EventOrganizer))
+        return bool(user.PERMS & Perm.CREATE)
     
     def authorize_attendee_view(self, user: User, event_organizer_id: str = None) -> bool:
         """
@@ -162,12 +164,14 @@ class AuthController:
         Returns:
             bool: True if user is authorized
         """
+        perms = user.PERMS
+        
         # Admins can view all attendees
-        if isinstance(user, Admin):
+        if perms & Perm.VIEW_ALL:
             return True
         
         # Event organizers can view their own event attendees
-        if isinstance(user, EventOrganizer):
+        if perms & Perm.MANAGE_OWN:
             if event_organizer_id is None or user.user_id == event_organizer_id:
                 return True
         
@@ -183,14 +187,15 @@ class AuthController:
         Returns:
             dict: Dictionary of permissions
         """
+        perms = user.PERMS
         permissions = {
-            'create_events': self.authorize_event_creation(user),
-            'manage_all_events': isinstance(user, Admin),
-            'manage_own_events': isinstance(user, (Admin, EventOrganizer)),
-            'view_all_attendees': isinstance(user, Admin),
-            'view_own_attendees': isinstance(user, (Admin, EventOrganizer)),
-            'manage_users': self.authorize_user_management(user),
-            'access_reports': self.authorize_system_reports(user),
+            'create_events': bool(perms & Perm.CREATE),
+            'manage_all_events': bool(perms & Perm.MANAGE_ALL),
+            'manage_own_events': bool(perms & Perm.MANAGE_OWN),
+            'view_all_attendees': bool(perms & Perm.VIEW_ALL),
+            'view_own_attendees': bool(perms & Perm.MANAGE_OWN),
+            'manage_users': bool(perms & Perm.MANAGE_USERS),
+            'access_reports': bool(perms & Perm.REPORTS),
             'register_for_events': True,  # All users can register
             'search_events': True,  # All users can search
         }
@@ -431,7 +436,8 @@ class AuthController:
             print("Password must be at least 6 characters long")
             return False
         
-        target_user.password = new_password
+        if not self.user_controller.update_user(target_user.user_id, password=new_password):
+            return False
         
         # Clear any failed attempts for this user
         self._clear_failed_attempts(target_username)
@@ -5,11 +5,15 @@ This module handles all event-related business logic and operations.
 Manages event CRUD operations, registration, and statistics.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterable
 from datetime import datetime, date
 from models.event import Event, sort_events_by_date, filter_upcoming_events
 from models.user import User
 
+# Maximum number of query results kept by EventController._cached_query
+_QUERY_CACHE_SIZE = 64
+
 class EventController:
     """Controller for managing events and registrations"""
     
@@ -22,6 +26,13 @@ class EventController:
         """
         self.events = []  # List of Event objects
         self.file_manager = file_manager
+        self._by_id = {}  # event_id -> Event, kept in sync with self.events
+        self._by_organizer = {}  # organizer_id -> [Event], in insertion order
+        self._dirty = set()  # IDs of events changed since the last save
+        
+        # Query results reused until the next structural change to the events,
+        # least recently used first out once _QUERY_CACHE_SIZE is reached
+        self._query_cache = OrderedDict()
     
     def add_event(self, event: Event) -> bool:
         """
@@ -40,11 +51,87 @@ class EventController:
                 return False
             
             self.events.append(event)
+            self._by_id[event.event_id] = event
+            self._by_organizer.setdefault(event.organizer_id, []).append(event)
+            self._dirty.add(event.event_id)
+            self._invalidate_queries()
             return True
         except Exception as e:
             print(f"Error adding event: {e}")
             return False
     
+    def bulk_add_events(self, events: Iterable[Event]) -> int:
+        """
+        Add many events at once, e.g. when loading from storage
+        
+        Duplicates are detected against a set of (name, date) keys built once
+        for the whole batch instead of rescanning the event list per event.
+        
+        Args:
+            events (Iterable[Event]): Event objects to add
+            
+        Returns:
+            int: Number of events added
+        """
+        active_keys = {(event.name.lower(), event.date)
+                       for event in self.events if event.status == "active"}
+        batch = []
+        
+        for event in events:
+            key = (event.name.lower(), event.date)
+            if key in active_keys:
+                print(f"Warning: Event '{event.name}' already exists on {event.date}")
+                continue
+            if event.status == "active":
+                active_keys.add(key)
+            batch.append(event)
+        
+        self.events.extend(batch)
+        self._by_id.update((event.event_id, event) for event in batch)
+        for event in batch:
+            self._by_organizer.setdefault(event.organizer_id, []).append(event)
+        if batch:
+            self._invalidate_queries()
+        return len(batch)
+    
+    def _invalidate_queries(self) -> None:
+        """Drop cached query results"""
+        self._query_cache.clear()
+    
+    def _cached_query(self, key, compute) -> List[Event]:
+        """
+        Return a copy of a cached query result, computing it on a miss
+        
+        Args:
+            key: Hashable cache key for the query
+            compute: Zero-argument callable producing the result list
+            
+        Returns:
+            List[Event]: Query result
+        """
+        cache = self._query_cache
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = compute()
+            if len(cache) > _QUERY_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return list(result)
+    
+    def has_unsaved_changes(self) -> bool:
+        """
+        Check whether any event changed since the last save
+        
+        Returns:
+            bool: True if there are unsaved event changes
+        """
+        return bool(self._dirty)
+    
+    def mark_saved(self) -> None:
+        """Forget pending changes after the events have been persisted"""
+        self._dirty.clear()
+    
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
         """
         Get event by ID
@@ -55,10 +142,7 @@ class EventController:
         Returns:
             Event or None: Event object if found
         """
-        for event in self.events:
-            if event.event_id == event_id:
-                return event
-        return None
+        return self._by_id.get(event_id)
     
     def get_all_events(self) -> List[Event]:
         """
@@ -76,8 +160,11 @@ class EventController:
         Returns:
             List[Event]: List of upcoming events sorted by date
         """
-        upcoming = filter_upcoming_events(self.events)
-        return sort_events_by_date(upcoming)
+        # Keyed by the current minute, since events drop out as time passes
+        minute = datetime.now().strftime('%Y-%m-%d %H:%M')
+        return self._cached_query(
+            ('upcoming', minute),
+            lambda: sort_events_by_date(filter_upcoming_events(self.events)))
     
     def get_events_by_organizer(self, organizer_id: str) -> List[Event]:
         """
@@ -89,9 +176,11 @@ class EventController:
         Returns:
             List[Event]: List of events organized by the user
         """
-        organizer_events = [event for event in self.events 
-                          if event.organizer_id == organizer_id]
-        return sort_events_by_date(organizer_events)
+        # organizer_id is not editable via update_details, so the buckets only
+        # change on add/delete; sorting is redone because dates can change
+        return self._cached_query(
+            ('organizer', organizer_id),
+            lambda: sort_events_by_date(self._by_organizer.get(organizer_id, ())))
     
     def get_user_events(self, user_id: str) -> List[Event]:
         """
@@ -131,6 +220,8 @@ class EventController:
                     return False
             
             event.update_details(**updates)
+            self._dirty.add(event_id)
+            self._invalidate_queries()
             return True
         except Exception as e:
             print(f"Error updating event: {e}")
@@ -152,6 +243,13 @@ class EventController:
         
         try:
             self.events.remove(event)
+            del self._by_id[event_id]
+            organizer_events = self._by_organizer[event.organizer_id]
+            organizer_events.remove(event)
+            if not organizer_events:
+                del self._by_organizer[event.organizer_id]
+            self._dirty.add(event_id)
+            self._invalidate_queries()
             return True
         except Exception as e:
             print(f"Error deleting event: {e}")
@@ -193,6 +291,7 @@ class EventController:
         if event.add_attendee(user.user_id):
             # Add event to user's registered events
             user.add_registered_event(event_id)
+            self._dirty.add(event_id)
             return True
         
         return False
@@ -221,6 +320,7 @@ class EventController:
         if event.remove_attendee(user.user_id):
             # Remove event from user's registered events
             user.remove_registered_event(event_id)
+            self._dirty.add(event_id)
             return True
         
         return False
@@ -239,9 +339,10 @@ class EventController:
             return []
         
         name_lower = name.lower().strip()
-        matching_events = [event for event in self.events 
-                         if name_lower in event.name.lower() and event.status == "active"]
-        return sort_events_by_date(matching_events)
+        return self._cached_query(
+            ('name', name_lower),
+            lambda: sort_events_by_date([event for event in self.events
+                                         if name_lower in event.name.lower() and event.status == "active"]))
     
     def search_events_by_date(self, search_date: str) -> List[Event]:
         """
@@ -253,9 +354,10 @@ class EventController:
         Returns:
             List[Event]: List of events on that date
         """
-        matching_events = [event for event in self.events 
-                         if event.date == search_date and event.status == "active"]
-        return sort_events_by_date(matching_events)
+        return self._cached_query(
+            ('date', search_date),
+            lambda: sort_events_by_date([event for event in self.events
+                                         if event.date == search_date and event.status == "active"]))
     
     def search_events_by_location(self, location: str) -> List[Event]:
         """
@@ -271,9 +373,10 @@ class EventController:
             return []
         
         location_lower = location.lower().strip()
-        matching_events = [event for event in self.events 
-                         if location_lower in event.location.lower() and event.status == "active"]
-        return sort_events_by_date(matching_events)
+        return self._cached_query(
+            ('location', location_lower),
+            lambda: sort_events_by_date([event for event in self.events
+                                         if location_lower in event.location.lower() and event.status == "active"]))
     
     def get_events_by_capacity(self, min_capacity: int = 0, max_capacity: int = float('inf')) -> List[Event]:
         """
@@ -308,15 +411,19 @@ class EventController:
                 'capacity_utilization': 0
             }
         
-        total_attendees = sum(len(event.attendees) for event in self.events)
-        total_capacity = sum(event.capacity for event in self.events)
-        
-        # Find most and least popular events
-        events_with_attendees = [(event, len(event.attendees)) for event in self.events]
-        events_with_attendees.sort(key=lambda x: x[1])
-        
-        most_popular = events_with_attendees[-1] if events_with_attendees else (None, 0)
-        least_popular = events_with_attendees[0] if events_with_attendees else (None, 0)
+        # Totals and most/least popular events in a single pass. Ties keep the
+        # previous sort-based picks: the last of the most attended events and
+        # the first of the least attended ones.
+        total_attendees = total_capacity = 0
+        most_popular = least_popular = None
+        for event in self.events:
+            count = len(event.attendees)
+            total_attendees += count
+            total_capacity += event.capacity
+            if most_popular is None or count >= most_popular[1]:
+                most_popular = (event, count)
+            if least_popular is None or count < least_popular[1]:
+                least_popular = (event, count)
         
         upcoming_events = len(self.get_upcoming_events())
         
@@ -401,6 +508,8 @@ class EventController:
             return False
         
         event.cancel_event()
+        self._dirty.add(event_id)
+        self._invalidate_queries()
         return True
     
     def complete_event(self, event_id: str) -> bool:
@@ -418,6 +527,8 @@ class EventController:
             return False
         
         event.complete_event()
+        self._dirty.add(event_id)
+        self._invalidate_queries()
         return True
     
     def get_events_needing_attention(self) -> List[Event]:
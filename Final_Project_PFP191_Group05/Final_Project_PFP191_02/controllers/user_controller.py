@@ -5,9 +5,56 @@ This module handles all user-related business logic and operations.
 Manages user CRUD operations, authentication support, and user statistics.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+import sys
+from typing import List, Dict, Any, Optional, Iterable
 from models.user import User, Admin, EventOrganizer, Student, Visitor
 
+# Compiled once at import; rejects values with no domain part or embedded whitespace
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# (field, required message, rule) for validate_user_data; a rule returns an error or None
+_USER_DATA_RULES = (
+    ('username', "Username is required",
+     lambda v: "Username must be at least 3 characters long" if len(v) < 3 else None),
+    ('password', "Password is required",
+     lambda v: "Password must be at least 6 characters long" if len(v) < 6 else None),
+    ('name', "Name is required", lambda v: None),
+    ('email', "Email is required",
+     lambda v: None if _EMAIL_RE.match(v) else "Invalid email format"),
+)
+
+# Role-specific dispatch tables, keyed by the exact user class
+_BASE_FIELDS = frozenset(map(sys.intern, ('username', 'name', 'email', 'password')))
+
+_ALLOWED_BY_ROLE = {
+    Admin: _BASE_FIELDS,
+    EventOrganizer: _BASE_FIELDS | {sys.intern('department')},
+    Student: _BASE_FIELDS | {sys.intern('student_id')},
+    Visitor: _BASE_FIELDS | {sys.intern('organization')},
+}
+
+_USER_FACTORIES = {
+    'admin': lambda d: Admin(d['username'], d['password'], d['name'], d['email']),
+    'event_organizer': lambda d: EventOrganizer(d['username'], d['password'], d['name'],
+                                                d['email'], d.get('department', '')),
+    'student': lambda d: Student(d['username'], d['password'], d['name'],
+                                 d['email'], d.get('student_id', '')),
+    'visitor': lambda d: Visitor(d['username'], d['password'], d['name'],
+                                 d['email'], d.get('organization')),
+}
+
+_ROLE_PROFILE_BUILDER = {
+    Admin: lambda u: {'admin_privileges': True},
+    EventOrganizer: lambda u: {
+        'department': u.department,
+        'organized_events_count': len(u.organized_events),
+        'organized_events': list(u.organized_events)
+    },
+    Student: lambda u: {'student_id': u.student_id},
+    Visitor: lambda u: {'organization': u.organization},
+}
+
 class UserController:
     """Controller for managing users and user-related operations"""
     
@@ -20,6 +67,24 @@ class UserController:
         """
         self.users = []  # List of User objects
         self.file_manager = file_manager
+        
+        # Hash indexes kept in sync with self.users by add_user and delete_user
+        self._by_username = {}  # casefolded username -> User
+        self._by_email = {}  # casefolded email -> User
+        self._by_id = {}  # user_id -> User
+        self._by_role = {Admin: [], EventOrganizer: [], Student: [], Visitor: []}
+        self._positions = {}  # user_id -> index in self.users
+        
+        self._dirty = set()  # IDs of users changed since the last save
+        
+        # Casefolded "name\0username\0email" per user, parallel to self.users
+        self._search_blob = []
+        
+        # Running registration totals, updated through each user's registration listener
+        self._total_registrations = 0
+        self._users_with_regs = {}  # insertion-ordered set of users with registrations
+        self._most_active = None  # (registration count, User) or None
+        self._most_active_dirty = False
     
     def add_user(self, user: User) -> bool:
         """
@@ -32,22 +97,93 @@ class UserController:
             bool: True if user added successfully
         """
         try:
+            user._username_cf = user.username.casefold()
+            user._email_cf = user.email.casefold()
+            
             # Check for duplicate username
-            if self.get_user_by_username(user.username):
+            if user._username_cf in self._by_username:
                 print(f"Username '{user.username}' already exists")
                 return False
             
             # Check for duplicate email
-            if self.get_user_by_email(user.email):
+            if user._email_cf in self._by_email:
                 print(f"Email '{user.email}' already exists")
                 return False
             
-            self.users.append(user)
+            self._insert_user(user)
+            self._dirty.add(user.user_id)
             return True
         except Exception as e:
             print(f"Error adding user: {e}")
             return False
     
+    def has_unsaved_changes(self) -> bool:
+        """
+        Check whether any user changed since the last save
+        
+        Returns:
+            bool: True if there are unsaved user changes
+        """
+        return bool(self._dirty)
+    
+    def mark_saved(self) -> None:
+        """Forget pending changes after the users have been persisted"""
+        self._dirty.clear()
+    
+    def bulk_add_users(self, users: Iterable[User]) -> int:
+        """
+        Add many users at once, e.g. when loading from storage
+        
+        Args:
+            users (Iterable[User]): User objects to add
+            
+        Returns:
+            int: Number of users added
+        """
+        added = 0
+        
+        for user in users:
+            user._username_cf = user.username.casefold()
+            user._email_cf = user.email.casefold()
+            if user._username_cf in self._by_username:
+                print(f"Username '{user.username}' already exists")
+                continue
+            if user._email_cf in self._by_email:
+                print(f"Email '{user.email}' already exists")
+                continue
+            self._insert_user(user)
+            added += 1
+        
+        return added
+    
+    def _insert_user(self, user: User) -> None:
+        """
+        Append a user and register it in every index, without duplicate checks
+        
+        Args:
+            user (User): User object already known to be unique, with its
+                _username_cf and _email_cf keys already set
+            
+        Raises:
+            ValueError: If the user's class has no role bucket; nothing is
+                inserted in that case
+        """
+        # Resolve the role bucket before touching any index, so an unknown
+        # subclass cannot leave the user half-inserted
+        role_bucket = self._by_role.get(type(user))
+        if role_bucket is None:
+            raise ValueError(f"Unsupported user type: {type(user).__name__}")
+        
+        user._basic_info_cache = None
+        self._positions[user.user_id] = len(self.users)
+        self.users.append(user)
+        self._search_blob.append(self._search_key(user))
+        self._by_username[user._username_cf] = user
+        self._by_email[user._email_cf] = user
+        self._by_id[user.user_id] = user
+        role_bucket.append(user)
+        self._track_registrations(user)
+    
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """
         Get user by ID
@@ -58,10 +194,7 @@ class UserController:
         Returns:
             User or None: User object if found
         """
-        for user in self.users:
-            if user.user_id == user_id:
-                return user
-        return None
+        return self._by_id.get(user_id)
     
     def get_user_by_username(self, username: str) -> Optional[User]:
         """
@@ -73,10 +206,7 @@ class UserController:
         Returns:
             User or None: User object if found
         """
-        for user in self.users:
-            if user.username.lower() == username.lower():
-                return user
-        return None
+        return self._by_username.get(username.casefold())
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -88,10 +218,7 @@ class UserController:
         Returns:
             User or None: User object if found
         """
-        for user in self.users:
-            if user.email.lower() == email.lower():
-                return user
-        return None
+        return self._by_email.get(email.casefold())
     
     def get_all_users(self) -> List[User]:
         """
@@ -119,11 +246,7 @@ class UserController:
             'visitor': Visitor
         }
         
-        target_class = role_classes.get(role.lower())
-        if not target_class:
-            return []
-        
-        return [user for user in self.users if isinstance(user, target_class)]
+        return list(self._by_role.get(role_classes.get(role.lower()), []))
     
     def update_user(self, user_id: str, **updates) -> bool:
         """
@@ -157,21 +280,31 @@ class UserController:
                     print(f"Email '{new_email}' already exists")
                     return False
             
-            # Update allowed fields
-            allowed_fields = ['username', 'name', 'email', 'password']
+            # Update allowed fields, including role-specific ones
+            allowed_fields = _ALLOWED_BY_ROLE.get(type(user), _BASE_FIELDS)
             
-            # Add role-specific fields
-            if isinstance(user, Student):
-                allowed_fields.append('student_id')
-            elif isinstance(user, EventOrganizer):
-                allowed_fields.append('department')
-            elif isinstance(user, Visitor):
-                allowed_fields.append('organization')
+            old_username = user.username
+            old_name = user.name
+            old_email = user.email
             
             for field, value in updates.items():
                 if field in allowed_fields and hasattr(user, field):
                     setattr(user, field, value)
             
+            # Re-key indexes, dropping the old keys first so stale entries can't resolve
+            if user.username != old_username:
+                self._by_username.pop(user._username_cf, None)
+                user._username_cf = user.username.casefold()
+                self._by_username[user._username_cf] = user
+            if user.email != old_email:
+                self._by_email.pop(user._email_cf, None)
+                user._email_cf = user.email.casefold()
+                self._by_email[user._email_cf] = user
+            if (user.username, user.name, user.email) != (old_username, old_name, old_email):
+                self._search_blob[self._positions[user.user_id]] = self._search_key(user)
+            self._dirty.add(user_id)
+            user._basic_info_cache = None
+            
             return True
         except Exception as e:
             print(f"Error updating user: {e}")
@@ -192,7 +325,20 @@ class UserController:
             return False
         
         try:
-            self.users.remove(user)
+            # Swap the last user into the vacated slot instead of shifting the list
+            position = self._positions.pop(user.user_id)
+            last = self.users.pop()
+            last_blob = self._search_blob.pop()
+            if position != len(self.users):
+                self.users[position] = last
+                self._search_blob[position] = last_blob
+                self._positions[last.user_id] = position
+            self._by_username.pop(user._username_cf, None)
+            self._by_email.pop(user._email_cf, None)
+            self._by_id.pop(user.user_id, None)
+            self._dirty.add(user.user_id)
+            self._by_role[type(user)].remove(user)
+            self._untrack_registrations(user)
             return True
         except Exception as e:
             print(f"Error deleting user: {e}")
@@ -239,6 +385,7 @@ class UserController:
             return False
         
         user.password = new_password
+        self._dirty.add(user_id)
         return True
     
     def get_user_statistics(self) -> Dict[str, int]:
@@ -248,25 +395,13 @@ class UserController:
         Returns:
             dict: User count by role
         """
-        stats = {
-            'admin': 0,
-            'event_organizer': 0,
-            'student': 0,
-            'visitor': 0,
+        return {
+            'admin': len(self._by_role[Admin]),
+            'event_organizer': len(self._by_role[EventOrganizer]),
+            'student': len(self._by_role[Student]),
+            'visitor': len(self._by_role[Visitor]),
             'total': len(self.users)
         }
-        
-        for user in self.users:
-            if isinstance(user, Admin):
-                stats['admin'] += 1
-            elif isinstance(user, EventOrganizer):
-                stats['event_organizer'] += 1
-            elif isinstance(user, Student):
-                stats['student'] += 1
-            elif isinstance(user, Visitor):
-                stats['visitor'] += 1
-        
-        return stats
     
     def search_users(self, query: str) -> List[User]:
         """
@@ -281,16 +416,14 @@ class UserController:
         if not query.strip():
             return []
         
-        query_lower = query.lower().strip()
-        matching_users = []
-        
-        for user in self.users:
-            if (query_lower in user.name.lower() or 
-                query_lower in user.username.lower() or 
-                query_lower in user.email.lower()):
-                matching_users.append(user)
-        
-        return matching_users
+        query_cf = query.strip().casefold()
+        users = self.users
+        return [users[i] for i, blob in enumerate(self._search_blob) if query_cf in blob]
+    
+    @staticmethod
+    def _search_key(user: User) -> str:
+        """Build the combined casefolded search string for a user"""
+        return f"{user.name}\0{user.username}\0{user.email}".casefold()
     
     def get_active_users(self, days: int = 30) -> List[User]:
         """
@@ -304,8 +437,7 @@ class UserController:
         """
         # This would require event participation data
         # For now, return users who have registered events
-        active_users = [user for user in self.users if user.registered_events]
-        return active_users
+        return list(self._users_with_regs)
     
     def get_organizers_with_events(self) -> List[EventOrganizer]:
         """
@@ -314,14 +446,8 @@ class UserController:
         Returns:
             List[EventOrganizer]: List of organizers with events
         """
-        organizers = self.get_users_by_role('event_organizer')
-        active_organizers = []
-        
-        for organizer in organizers:
-            if hasattr(organizer, 'organized_events') and organizer.organized_events:
-                active_organizers.append(organizer)
-        
-        return active_organizers
+        return [organizer for organizer in self._by_role[EventOrganizer]
+                if organizer.organized_events]
     
     def get_user_engagement_report(self) -> Dict[str, Any]:
         """
@@ -331,15 +457,14 @@ class UserController:
             dict: User engagement statistics
         """
         total_users = len(self.users)
-        users_with_registrations = len([u for u in self.users if u.registered_events])
+        users_with_registrations = len(self._users_with_regs)
         
         # Calculate average registrations per user
-        total_registrations = sum(len(u.registered_events) for u in self.users)
+        total_registrations = self._total_registrations
         avg_registrations = total_registrations / total_users if total_users > 0 else 0
         
         # Get most active user
-        most_active_user = max(self.users, 
-                             key=lambda u: len(u.registered_events)) if self.users else None
+        most_active_user = self._get_most_active_user()
         
         return {
             'total_users': total_users,
@@ -353,6 +478,98 @@ class UserController:
             } if most_active_user else None
         }
     
+    def _track_registrations(self, user: User) -> None:
+        """
+        Fold a newly added user into the running registration totals
+        
+        Args:
+            user (User): User that was just added
+        """
+        user._registration_listener = self._on_registration_change
+        count = len(user.registered_events)
+        self._total_registrations += count
+        if count:
+            self._mark_active(user)
+        if not self._most_active_dirty and (self._most_active is None or count > self._most_active[0]):
+            self._most_active = (count, user)
+    
+    def _untrack_registrations(self, user: User) -> None:
+        """
+        Remove a deleted user from the running registration totals
+        
+        Args:
+            user (User): User that was just deleted
+        """
+        user._registration_listener = None
+        count = len(user.registered_events)
+        self._total_registrations -= count
+        if count:
+            self._mark_inactive(user)
+        if self._most_active and self._most_active[1] is user:
+            self._most_active_dirty = True
+    
+    def _on_registration_change(self, user: User, delta: int) -> None:
+        """
+        Registration listener installed on every tracked user
+        
+        Args:
+            user (User): User whose registrations changed
+            delta (int): +1 for a new registration, -1 for a removed one
+        """
+        count = len(user.registered_events)
+        self._total_registrations += delta
+        self._dirty.add(user.user_id)
+        
+        if delta > 0:
+            if count == 1:
+                self._mark_active(user)
+            if not self._most_active_dirty and (self._most_active is None or count > self._most_active[0]):
+                self._most_active = (count, user)
+        else:
+            if count == 0:
+                self._mark_inactive(user)
+            if self._most_active and self._most_active[1] is user:
+                # The leader may have been overtaken; recompute on next read
+                self._most_active_dirty = True
+    
+    def _mark_active(self, user: User) -> None:
+        """Record that a user now has at least one registration"""
+        self._users_with_regs[user] = None
+    
+    def _mark_inactive(self, user: User) -> None:
+        """Record that a user no longer has any registrations"""
+        self._users_with_regs.pop(user, None)
+    
+    def _get_most_active_user(self) -> Optional[User]:
+        """
+        Get the user with the most registrations, recomputing only when stale
+        
+        Returns:
+            User or None: Most active user
+        """
+        if self._most_active_dirty:
+            self._recount_registrations()
+        
+        return self._most_active[1] if self._most_active else None
+    
+    def _recount_registrations(self) -> None:
+        """Recompute every registration counter and the leader in a single pass"""
+        total = 0
+        with_regs = {}
+        best = None
+        for user in self.users:
+            count = len(user.registered_events)
+            total += count
+            if count:
+                with_regs[user] = None
+            if best is None or count > best[0]:
+                best = (count, user)
+        
+        self._total_registrations = total
+        self._users_with_regs = with_regs
+        self._most_active = best
+        self._most_active_dirty = False
+    
     def validate_user_data(self, user_data: Dict[str, Any]) -> Dict[str, str]:
         """
         Validate user data for creation/update
@@ -365,26 +582,15 @@ class UserController:
         """
         errors = {}
         
-        # Required fields
-        required_fields = ['username', 'password', 'name', 'email']
-        for field in required_fields:
-            if not user_data.get(field, '').strip():
-                errors[field] = f"{field.title()} is required"
-        
-        # Username validation
-        username = user_data.get('username', '')
-        if username and len(username) < 3:
-            errors['username'] = "Username must be at least 3 characters long"
-        
-        # Password validation
-        password = user_data.get('password', '')
-        if password and len(password) < 6:
-            errors['password'] = "Password must be at least 6 characters long"
-        
-        # Email validation (basic)
-        email = user_data.get('email', '')
-        if email and '@' not in email:
-            errors['email'] = "Invalid email format"
+        # Every field is required; non-blank values then go through the field's rule
+        for field, required_message, rule in _USER_DATA_RULES:
+            value = user_data.get(field, '')
+            if not value.strip():
+                errors[field] = required_message
+                continue
+            message = rule(value)
+            if message:
+                errors[field] = message
         
         return errors
     
@@ -402,34 +608,31 @@ class UserController:
         if not user:
             return {}
         
-        profile = {
-            'basic_info': {
+        # Identity fields only change through update_user, which drops this cache
+        basic_info = user._basic_info_cache
+        if basic_info is None:
+            basic_info = user._basic_info_cache = {
                 'user_id': user.user_id,
                 'username': user.username,
                 'name': user.name,
                 'email': user.email,
                 'role': user.get_role(),
                 'created_at': user.created_at
-            },
+            }
+        
+        registered_events = user.registered_events
+        profile = {
+            'basic_info': basic_info,
             'activity': {
-                'registered_events_count': len(user.registered_events),
-                'registered_events': user.registered_events
+                'registered_events_count': len(registered_events),
+                'registered_events': list(registered_events)
             }
         }
         
         # Add role-specific information
-        if isinstance(user, Student):
-            profile['role_info'] = {'student_id': user.student_id}
-        elif isinstance(user, EventOrganizer):
-            profile['role_info'] = {
-                'department': user.department,
-                'organized_events_count': len(getattr(user, 'organized_events', [])),
-                'organized_events': getattr(user, 'organized_events', [])
-            }
-        elif isinstance(user, Visitor):
-            profile['role_info'] = {'organization': user.organization}
-        elif isinstance(user, Admin):
-            profile['role_info'] = {'admin_privileges': True}
+        build_role_info = _ROLE_PROFILE_BUILDER.get(type(user))
+        if build_role_info:
+            profile['role_info'] = build_role_info(user)
         
         return profile
     
@@ -444,6 +647,9 @@ class UserController:
             dict: Import results with success/failure counts
         """
         results = {'success': 0, 'failed': 0, 'duplicates': 0}
+        existing_unames = set(self._by_username)
+        existing_emails = set(self._by_email)
+        accepted = []
         
         for user_data in users_data:
             try:
@@ -454,43 +660,37 @@ class UserController:
                     results['failed'] += 1
                     continue
                 
-                # Check for duplicates
-                if (self.get_user_by_username(user_data['username']) or 
-                    self.get_user_by_email(user_data['email'])):
+                # Check for duplicates (existing users and earlier rows)
+                uname_key = user_data['username'].casefold()
+                email_key = user_data['email'].casefold()
+                if uname_key in existing_unames or email_key in existing_emails:
                     results['duplicates'] += 1
                     continue
                 
                 # Create user based on type
                 user_type = user_data.get('user_type', 'student')
-                if user_type == 'admin':
-                    user = Admin(user_data['username'], user_data['password'],
-                               user_data['name'], user_data['email'])
-                elif user_type == 'event_organizer':
-                    user = EventOrganizer(user_data['username'], user_data['password'],
-                                        user_data['name'], user_data['email'],
-                                        user_data.get('department', ''))
-                elif user_type == 'student':
-                    user = Student(user_data['username'], user_data['password'],
-                                 user_data['name'], user_data['email'],
-                                 user_data.get('student_id', ''))
-                elif user_type == 'visitor':
-                    user = Visitor(user_data['username'], user_data['password'],
-                                 user_data['name'], user_data['email'],
-                                 user_data.get('organization'))
-                else:
+                factory = _USER_FACTORIES.get(user_type)
+                if factory is None:
                     print(f"Unknown user type: {user_type}")
                     results['failed'] += 1
                     continue
+                user = factory(user_data)
                 
-                if self.add_user(user):
-                    results['success'] += 1
-                else:
-                    results['failed'] += 1
+                user._username_cf = uname_key
+                user._email_cf = email_key
+                existing_unames.add(uname_key)
+                existing_emails.add(email_key)
+                accepted.append(user)
                     
             except Exception as e:
                 print(f"Error importing user: {e}")
                 results['failed'] += 1
         
+        for user in accepted:
+            self._insert_user(user)
+            self._dirty.add(user.user_id)
+        results['success'] = len(accepted)
+        
         return results
     
     def export_users_data(self) -> List[Dict[str, Any]]:
@@ -15,13 +15,13 @@ from datetime import datetime
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from models.user import User, Admin, EventOrganizer, Student, Visitor
+from models.user import User, Admin, EventOrganizer, Student, Visitor, UserFactory, Perm
 from models.event import Event
 from controllers.event_controller import EventController
 from controllers.user_controller import UserController
 from controllers.auth_controller import AuthController
 from utils.file_manager import FileManager
-from utils.validators import InputValidator
+from utils.validators import validate_date, validate_email, validate_time
 from views.ui import UI
 
 class CampusEventManagementSystem:
@@ -35,6 +35,14 @@ class CampusEventManagementSystem:
         self.auth_controller = AuthController(self.user_controller)
         self.ui = UI()
         self.current_user = None
+        self._current_uid = None  # Cached at login to avoid repeated attribute lookups
+        self._current_name = None
+        
+        # Role-specific main menus; Students and Visitors fall back to the user menu
+        self._menus_by_role = {
+            Admin: self._admin_menu,
+            EventOrganizer: self._organizer_menu,
+        }
         
         # Load existing data
         self._load_system_data()
@@ -44,16 +52,13 @@ class CampusEventManagementSystem:
         try:
             # Load events
             events_data = self.file_manager.load_events()
-            for event_data in events_data:
-                event = Event.from_dict(event_data)
-                self.event_controller.add_event(event)
+            self.event_controller.bulk_add_events(
+                Event.from_dict(event_data) for event_data in events_data)
             
             # Load users
             users_data = self.file_manager.load_users()
-            for user_data in users_data:
-                user = self._create_user_from_data(user_data)
-                if user:
-                    self.user_controller.add_user(user)
+            self.user_controller.bulk_add_users(
+                filter(None, map(self._create_user_from_data, users_data)))
                     
         except Exception as e:
             print(f"Warning: Could not load system data: {e}")
@@ -61,16 +66,10 @@ class CampusEventManagementSystem:
     
     def _create_user_from_data(self, user_data):
         """Create appropriate user object from data dictionary"""
-        user_type = user_data.get('user_type')
-        if user_type == 'admin':
-            return Admin.from_dict(user_data)
-        elif user_type == 'event_organizer':
-            return EventOrganizer.from_dict(user_data)
-        elif user_type == 'student':
-            return Student.from_dict(user_data)
-        elif user_type == 'visitor':
-            return Visitor.from_dict(user_data)
-        return None
+        try:
+            return UserFactory.from_dict(user_data)
+        except ValueError:
+            return None  # Unknown user type
     
     def _initialize_default_data(self):
         """Initialize system with default admin account"""
@@ -118,6 +117,8 @@ class CampusEventManagementSystem:
         user = self.auth_controller.authenticate(username, password)
         if user:
             self.current_user = user
+            self._current_uid = user.user_id
+            self._current_name = user.name
             print(f"Welcome, {user.name}! You are logged in as {user.get_role()}.")
         else:
             print("Invalid username or password.")
@@ -146,7 +147,7 @@ class CampusEventManagementSystem:
             print("All fields are required.")
             return
         
-        if not InputValidator.validate_email(email):
+        if not validate_email(email):
             print("Invalid email format.")
             return
         
@@ -172,12 +173,7 @@ class CampusEventManagementSystem:
     
     def _handle_main_menu(self):
         """Handle main menu based on user role"""
-        if isinstance(self.current_user, Admin):
-            self._admin_menu()
-        elif isinstance(self.current_user, EventOrganizer):
-            self._organizer_menu()
-        else:  # Student or Visitor
-            self._user_menu()
+        self._menus_by_role.get(type(self.current_user), self._user_menu)()
     
     def _admin_menu(self):
         """Admin menu and operations"""
@@ -189,7 +185,7 @@ class CampusEventManagementSystem:
         elif choice == '2':
             self._view_all_events()
         elif choice == '3':
-            self._update_event()
+            self._update_event_as_admin()
         elif choice == '4':
             self._delete_event()
         elif choice == '5':
@@ -255,13 +251,13 @@ class CampusEventManagementSystem:
         
         # Get and validate date
         date_str = input("Date (YYYY-MM-DD): ").strip()
-        if not InputValidator.validate_date(date_str):
+        if not validate_date(date_str):
             print("Invalid date format. Please use YYYY-MM-DD.")
             return
         
         # Get and validate time
         time_str = input("Time (HH:MM): ").strip()
-        if not InputValidator.validate_time(time_str):
+        if not validate_time(time_str):
             print("Invalid time format. Please use HH:MM.")
             return
         
@@ -284,7 +280,7 @@ class CampusEventManagementSystem:
             time=time_str,
             location=location,
             capacity=capacity,
-            organizer_id=self.current_user.user_id
+            organizer_id=self._current_uid
         )
         
         if self.event_controller.add_event(event):
@@ -299,13 +295,14 @@ class CampusEventManagementSystem:
             print("No events found.")
             return
         
-        print("\n=== All Events ===")
+        out = ["\n=== All Events ==="]
         for event in events:
-            print(f"\n{event}")
-            print(f"Attendees: {len(event.attendees)}/{event.capacity}")
+            out.append(f"\n{event}")
+            out.append(f"Attendees: {len(event.attendees)}/{event.capacity}")
+        sys.stdout.write("\n".join(out) + "\n")
     
-    def _update_event(self):
-        """Update an existing event"""
+    def _update_event_as_admin(self):
+        """Update any event by ID; admins need no ownership check"""
         event_id = input("Enter Event ID to update: ").strip()
         event = self.event_controller.get_event_by_id(event_id)
         
@@ -313,50 +310,71 @@ class CampusEventManagementSystem:
             print("Event not found.")
             return
         
-        # Check permission (admin or organizer of the event)
-        if not isinstance(self.current_user, Admin) and event.organizer_id != self.current_user.user_id:
-            print("You don't have permission to update this event.")
-            return
+        self._apply_event_updates(event)
+    
+    def _update_event_as_owner(self, event: Event):
+        """
+        Update an event picked from the organizer's own event list
+        
+        Args:
+            event (Event): Event already known to belong to the current user
+        """
+        self._apply_event_updates(event)
+    
+    def _apply_event_updates(self, event: Event):
+        """
+        Prompt for new field values and apply them through the controller
+        
+        Callers are responsible for the permission check.
         
+        Args:
+            event (Event): Event to update
+        """
         print(f"\nCurrent event details:\n{event}")
         print("\nEnter new values (press Enter to keep current value):")
         
-        # Update fields
+        # Collect changed fields and apply them through the controller
+        updates = {}
+        
         new_name = input(f"Name [{event.name}]: ").strip()
         if new_name:
-            event.name = new_name
+            updates['name'] = new_name
         
         new_desc = input(f"Description [{event.description}]: ").strip()
         if new_desc:
-            event.description = new_desc
+            updates['description'] = new_desc
         
         new_date = input(f"Date [{event.date}]: ").strip()
-        if new_date and InputValidator.validate_date(new_date):
-            event.date = new_date
+        if new_date and validate_date(new_date):
+            updates['date'] = new_date
         elif new_date:
             print("Invalid date format, keeping current date.")
         
         new_time = input(f"Time [{event.time}]: ").strip()
-        if new_time and InputValidator.validate_time(new_time):
-            event.time = new_time
+        if new_time and validate_time(new_time):
+            updates['time'] = new_time
         elif new_time:
             print("Invalid time format, keeping current time.")
         
         new_location = input(f"Location [{event.location}]: ").strip()
         if new_location:
-            event.location = new_location
+            updates['location'] = new_location
         
         new_capacity = input(f"Capacity [{event.capacity}]: ").strip()
         if new_capacity:
             try:
                 capacity = int(new_capacity)
                 if capacity >= len(event.attendees):
-                    event.capacity = capacity
+                    updates['capacity'] = capacity
                 else:
                     print(f"Capacity cannot be less than current attendees ({len(event.attendees)})")
             except ValueError:
                 print("Invalid capacity, keeping current capacity.")
         
+        if updates and not self.event_controller.update_event(event.event_id, **updates):
+            print("Failed to update event.")
+            return
+        
         print("Event updated successfully!")
     
     def _delete_event(self):
@@ -369,7 +387,7 @@ class CampusEventManagementSystem:
             return
         
         # Check permission
-        if not isinstance(self.current_user, Admin) and event.organizer_id != self.current_user.user_id:
+        if not self.current_user.PERMS & Perm.MANAGE_ALL and event.organizer_id != self._current_uid:
             print("You don't have permission to delete this event.")
             return
         
@@ -399,7 +417,7 @@ class CampusEventManagementSystem:
             events = self.event_controller.search_events_by_name(name)
         elif choice == '3':
             date = input("Enter date (YYYY-MM-DD): ").strip()
-            if not InputValidator.validate_date(date):
+            if not validate_date(date):
                 print("Invalid date format.")
                 return
             events = self.event_controller.search_events_by_date(date)
@@ -414,12 +432,13 @@ class CampusEventManagementSystem:
             print("No events found.")
             return
         
-        print(f"\nFound {len(events)} event(s):")
+        out = [f"\nFound {len(events)} event(s):"]
         for event in events:
             availability = event.capacity - len(event.attendees)
             status = "Available" if availability > 0 else "Full"
-            print(f"\n{event}")
-            print(f"Available spots: {availability} ({status})")
+            out.append(f"\n{event}")
+            out.append(f"Available spots: {availability} ({status})")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _register_for_event(self):
         """Register current user for an event"""
@@ -432,7 +451,7 @@ class CampusEventManagementSystem:
     
     def _view_my_registrations(self):
         """View current user's event registrations"""
-        events = self.event_controller.get_user_events(self.current_user.user_id)
+        events = self.event_controller.get_user_events(self._current_uid)
         
         if not events:
             print("You are not registered for any events.")
@@ -453,7 +472,7 @@ class CampusEventManagementSystem:
     
     def _view_my_events(self):
         """View events organized by current user"""
-        events = self.event_controller.get_events_by_organizer(self.current_user.user_id)
+        events = self.event_controller.get_events_by_organizer(self._current_uid)
         
         if not events:
             print("You haven't organized any events yet.")
@@ -466,7 +485,7 @@ class CampusEventManagementSystem:
     
     def _manage_event_attendees(self):
         """Manage attendees for organizer's events"""
-        events = self.event_controller.get_events_by_organizer(self.current_user.user_id)
+        events = self.event_controller.get_events_by_organizer(self._current_uid)
         
         if not events:
             print("You haven't organized any events yet.")
@@ -523,18 +542,21 @@ class CampusEventManagementSystem:
         """Show overall system statistics"""
         stats = self.event_controller.get_system_statistics()
         
-        print("\n=== System Statistics ===")
-        print(f"Total Events: {stats['total_events']}")
-        print(f"Total Registrations: {stats['total_attendees']}")
-        print(f"Average Attendees per Event: {stats['avg_attendees']:.1f}")
+        out = [
+            "\n=== System Statistics ===",
+            f"Total Events: {stats['total_events']}",
+            f"Total Registrations: {stats['total_attendees']}",
+            f"Average Attendees per Event: {stats['avg_attendees']:.1f}",
+        ]
         
         if stats['most_popular_event']:
-            print(f"Most Popular Event: {stats['most_popular_event']['name']} ({stats['most_popular_event']['attendees']} attendees)")
+            out.append(f"Most Popular Event: {stats['most_popular_event']['name']} ({stats['most_popular_event']['attendees']} attendees)")
         
         if stats['least_popular_event']:
-            print(f"Least Popular Event: {stats['least_popular_event']['name']} ({stats['least_popular_event']['attendees']} attendees)")
+            out.append(f"Least Popular Event: {stats['least_popular_event']['name']} ({stats['least_popular_event']['attendees']} attendees)")
         
-        print(f"Total Users: {len(self.user_controller.users)}")
+        out.append(f"Total Users: {len(self.user_controller.users)}")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _export_attendance_report(self):
         """Export attendance report to CSV"""
@@ -554,12 +576,11 @@ class CampusEventManagementSystem:
     def _export_all_data(self):
         """Export all system data"""
         try:
-            # Save current data
-            self._save_system_data()
-            
-            # Export reports
-            self.file_manager.export_attendance_report(self.event_controller.events)
-            self.file_manager.export_events_report(self.event_controller.events)
+            # Save data and export both reports in one pass over the events
+            if self.file_manager.save_and_export(self.event_controller.events,
+                                                 self.user_controller.export_users_data()):
+                self.event_controller.mark_saved()
+                self.user_controller.mark_saved()
             
             print("All data exported successfully!")
             print("Files created:")
@@ -597,17 +618,19 @@ class CampusEventManagementSystem:
             print("No users found.")
             return
         
-        print(f"\n=== All Users ({len(users)}) ===")
+        separator = "-" * 50
+        out = [f"\n=== All Users ({len(users)}) ==="]
         for user in users:
-            print(f"ID: {user.user_id} | {user.name} ({user.username}) - {user.get_role()}")
-            print(f"Email: {user.email}")
+            out.append(f"ID: {user.user_id} | {user.name} ({user.username}) - {user.get_role()}")
+            out.append(f"Email: {user.email}")
             if hasattr(user, 'student_id'):
-                print(f"Student ID: {user.student_id}")
+                out.append(f"Student ID: {user.student_id}")
             elif hasattr(user, 'department'):
-                print(f"Department: {user.department}")
+                out.append(f"Department: {user.department}")
             elif hasattr(user, 'organization') and user.organization:
-                print(f"Organization: {user.organization}")
-            print("-" * 50)
+                out.append(f"Organization: {user.organization}")
+            out.append(separator)
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _create_user_account(self):
         """Create user account (Admin only)"""
@@ -638,7 +661,7 @@ class CampusEventManagementSystem:
     
     def _update_my_event(self):
         """Update organizer's own event"""
-        events = self.event_controller.get_events_by_organizer(self.current_user.user_id)
+        events = self.event_controller.get_events_by_organizer(self._current_uid)
         
         if not events:
             print("You haven't organized any events yet.")
@@ -652,16 +675,8 @@ class CampusEventManagementSystem:
             choice = int(input("Select event number to update: ")) - 1
             if 0 <= choice < len(events):
                 selected_event = events[choice]
-                # Set the event ID and call update method
-                event_id = selected_event.event_id
                 print(f"Updating event: {selected_event.name}")
-                # Temporarily store event ID in input buffer simulation
-                import io
-                import sys
-                old_stdin = sys.stdin
-                sys.stdin = io.StringIO(event_id + "\n")
-                self._update_event()
-                sys.stdin = old_stdin
+                self._update_event_as_owner(selected_event)
             else:
                 print("Invalid selection.")
         except ValueError:
@@ -669,25 +684,31 @@ class CampusEventManagementSystem:
     
     def _view_event_statistics(self):
         """View statistics for organizer's events"""
-        events = self.event_controller.get_events_by_organizer(self.current_user.user_id)
+        events = self.event_controller.get_events_by_organizer(self._current_uid)
         
         if not events:
             print("You haven't organized any events yet.")
             return
         
-        print(f"\n=== Your Event Statistics ===")
-        total_capacity = sum(event.capacity for event in events)
-        total_registered = sum(len(event.attendees) for event in events)
+        # Accumulate totals and per-event lines in a single pass
+        total_capacity = total_registered = 0
+        details = []
+        for event in events:
+            registered = len(event.attendees)
+            capacity = event.capacity
+            total_capacity += capacity
+            total_registered += registered
+            fill_rate = (registered / capacity * 100) if capacity > 0 else 0
+            details.append(f"- {event.name}: {registered}/{capacity} ({fill_rate:.1f}% full)")
         
+        print(f"\n=== Your Event Statistics ===")
         print(f"Total Events Organized: {len(events)}")
         print(f"Total Capacity: {total_capacity}")
         print(f"Total Registered: {total_registered}")
         print(f"Overall Fill Rate: {(total_registered/total_capacity*100) if total_capacity > 0 else 0:.1f}%")
         
         print("\nEvent Details:")
-        for event in events:
-            fill_rate = (len(event.attendees) / event.capacity * 100) if event.capacity > 0 else 0
-            print(f"- {event.name}: {len(event.attendees)}/{event.capacity} ({fill_rate:.1f}% full)")
+        print("\n".join(details))
     
     def _view_all_attendees(self):
         """View all attendees across all events (Admin only)"""
@@ -697,33 +718,48 @@ class CampusEventManagementSystem:
             print("No events found.")
             return
         
-        print("\n=== All Event Attendees ===")
+        # Resolve every distinct attendee once instead of per event
+        get_user = self.user_controller.get_user_by_id
+        attendees = {attendee_id: get_user(attendee_id)
+                     for event in events for attendee_id in event.attendees}
+        
+        out = ["\n=== All Event Attendees ==="]
         for event in events:
-            print(f"\nEvent: {event.name}")
+            out.append(f"\nEvent: {event.name}")
             if not event.attendees:
-                print("  No attendees registered.")
+                out.append("  No attendees registered.")
                 continue
             
             for attendee_id in event.attendees:
-                user = self.user_controller.get_user_by_id(attendee_id)
+                user = attendees[attendee_id]
                 if user:
-                    print(f"  - {user.name} ({user.email}) - {user.get_role()}")
+                    out.append(f"  - {user.name} ({user.email}) - {user.get_role()}")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def _logout(self):
         """Logout current user"""
-        print(f"Goodbye, {self.current_user.name}!")
+        print(f"Goodbye, {self._current_name}!")
         self.current_user = None
+        self._current_uid = None
+        self._current_name = None
     
     def _save_system_data(self):
         """Save all system data to persistent storage"""
+        # Nothing changed since the last load/save, so the files are already current
+        if not (self.event_controller.has_unsaved_changes() or
+                self.user_controller.has_unsaved_changes()):
+            return
+        
         try:
-            # Save events
-            events_data = [event.to_dict() for event in self.event_controller.events]
-            self.file_manager.save_events(events_data)
+            # Save events without copying their attendee lists
+            events_data = [event.to_dict_view() for event in self.event_controller.events]
+            if self.file_manager.save_events(events_data):
+                self.event_controller.mark_saved()
             
             # Save users
-            users_data = [user.to_dict() for user in self.user_controller.users]
-            self.file_manager.save_users(users_data)
+            users_data = self.user_controller.export_users_data()
+            if self.file_manager.save_users(users_data):
+                self.user_controller.mark_saved()
             
         except Exception as e:
             print(f"Warning: Could not save system data: {e}")
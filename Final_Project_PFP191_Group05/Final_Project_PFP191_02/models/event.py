@@ -5,15 +5,73 @@ This module contains the Event class and related functionality
 for managing campus events with capacity control and attendee tracking.
 """
 
-import uuid
+import re
+from functools import lru_cache
 from datetime import datetime, date, time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from .ids import fast_id
+
+
+# Fields update_details may change; all are always set by Event.__init__
+_ALLOWED_UPDATE_FIELDS = frozenset(('name', 'description', 'date', 'time',
+                                    'location', 'capacity', 'status'))
+
+# Title suffixes for events that are no longer open
+_STATUS_SUFFIX = {'cancelled': ' [CANCELLED]', 'completed': ' [COMPLETED]'}
+
+# Canonical zero-padded formats; anything else falls back to strptime
+_DATE_RE = re.compile(r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$')
+_TIME_RE = re.compile(r'^([0-9]{2}):([0-9]{2})$')
+
+
+def _parse_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string into a date, or None if it is malformed"""
+    try:
+        match = _DATE_RE.match(value)
+        if match:
+            return date(int(match[1]), int(match[2]), int(match[3]))
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def _fast_parse_dt(date_str: str, time_str: str) -> Optional[datetime]:
+    """Parse date and time strings into a datetime, or None if they are malformed"""
+    try:
+        date_match = _DATE_RE.match(date_str)
+        time_match = _TIME_RE.match(time_str)
+        if date_match and time_match:
+            return datetime(int(date_match[1]), int(date_match[2]), int(date_match[3]),
+                            int(time_match[1]), int(time_match[2]))
+        return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return None
+
+
+_now = datetime.now
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string"""
+    return _now().isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _parse_event_dt(date_str: str, time_str: str) -> Optional[datetime]:
+    """Parse an event's date and time strings, shared across events with equal values"""
+    return _fast_parse_dt(date_str, time_str)
+
 
 class Event:
     """Event class for managing campus events"""
     
+    __slots__ = ('event_id', 'name', 'description', 'date', '_date_obj', 'time',
+                 '_parsed_dt', 'location', 'capacity', 'organizer_id', 'attendees',
+                 'created_at', 'updated_at', 'status', '_hash')
+    
     def __init__(self, name: str, description: str, date: str, time: str, 
-                 location: str, capacity: int, organizer_id: str):
+                 location: str, capacity: int, organizer_id: str,
+                 event_id: Optional[str] = None):
         """
         Initialize an event
         
@@ -25,18 +83,21 @@ class Event:
             location (str): Event location
             capacity (int): Maximum number of attendees
             organizer_id (str): ID of the event organizer
+            event_id (str): Existing ID when restoring an event; generated if omitted
         """
-        self.event_id = str(uuid.uuid4())
+        self.event_id = event_id if event_id is not None else fast_id()
+        self._hash = None  # event_id never changes after construction
         self.name = name
         self.description = description
         self.date = date
+        self._date_obj = _parse_date(date)  # parsed once; refreshed by update_details
         self.time = time
+        self._parsed_dt = None  # lazily filled by get_datetime
         self.location = location
         self.capacity = capacity
         self.organizer_id = organizer_id
-        self.attendees = []  # List of user IDs registered for this event
-        self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.attendees = {}  # Insertion-ordered set of registered user IDs (values unused)
+        self.created_at = self.updated_at = _now_iso()
         self.status = "active"  # active, cancelled, completed
     
     def add_attendee(self, user_id: str) -> bool:
@@ -55,8 +116,8 @@ class Event:
         if len(self.attendees) >= self.capacity:
             return False  # Event is full
         
-        self.attendees.append(user_id)
-        self.updated_at = datetime.now().isoformat()
+        self.attendees[user_id] = None
+        self.updated_at = _now_iso()
         return True
     
     def remove_attendee(self, user_id: str) -> bool:
@@ -72,8 +133,8 @@ class Event:
         if user_id not in self.attendees:
             return False  # Not registered
         
-        self.attendees.remove(user_id)
-        self.updated_at = datetime.now().isoformat()
+        del self.attendees[user_id]
+        self.updated_at = _now_iso()
         return True
     
     def is_full(self) -> bool:
@@ -98,53 +159,87 @@ class Event:
             return 0.0
         return (len(self.attendees) / self.capacity) * 100
     
-    def is_upcoming(self) -> bool:
-        """Check if event is in the future"""
-        try:
-            event_datetime = datetime.strptime(f"{self.date} {self.time}", "%Y-%m-%d %H:%M")
-            return event_datetime > datetime.now()
-        except ValueError:
+    def is_upcoming(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if event is in the future
+        
+        Args:
+            now (datetime): Reference time; pass one value when checking many events
+            
+        Returns:
+            bool: True if the event starts after now
+        """
+        event_date = self._date_obj
+        if event_date is None:
             return False
+        
+        if now is None:
+            now = _now()
+        
+        # Only an event happening today needs its time compared
+        today = now.date()
+        if event_date != today:
+            return event_date > today
+        
+        event_datetime = self._get_parsed_datetime()
+        return event_datetime is not None and event_datetime > now
     
-    def is_today(self) -> bool:
-        """Check if event is today"""
-        try:
-            event_date = datetime.strptime(self.date, "%Y-%m-%d").date()
-            return event_date == date.today()
-        except ValueError:
-            return False
+    def is_today(self, today: Optional[date] = None) -> bool:
+        """
+        Check if event is today
+        
+        Args:
+            today (date): Reference date; pass one value when checking many events
+            
+        Returns:
+            bool: True if the event falls on today
+        """
+        if today is None:
+            today = date.today()
+        return self._date_obj is not None and self._date_obj == today
+    
+    def _get_parsed_datetime(self) -> Optional[datetime]:
+        """Get the parsed event datetime, or None if date/time are malformed"""
+        parsed = self._parsed_dt
+        if parsed is None:
+            parsed = self._parsed_dt = _parse_event_dt(self.date, self.time)
+        return parsed
     
     def get_datetime(self) -> datetime:
         """Get event datetime as datetime object"""
-        try:
-            return datetime.strptime(f"{self.date} {self.time}", "%Y-%m-%d %H:%M")
-        except ValueError:
-            return datetime.now()
+        parsed = self._get_parsed_datetime()
+        return parsed if parsed is not None else _now()
     
     def update_details(self, **kwargs) -> None:
         """Update event details"""
-        allowed_fields = ['name', 'description', 'date', 'time', 'location', 'capacity', 'status']
-        
         for field, value in kwargs.items():
-            if field in allowed_fields and hasattr(self, field):
+            if field in _ALLOWED_UPDATE_FIELDS:
                 setattr(self, field, value)
         
-        self.updated_at = datetime.now().isoformat()
+        if 'date' in kwargs:
+            self._date_obj = _parse_date(self.date)
+        if 'date' in kwargs or 'time' in kwargs:
+            self._parsed_dt = None
+        
+        self.updated_at = _now_iso()
     
     def cancel_event(self) -> None:
         """Cancel the event"""
         self.status = "cancelled"
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
     
     def complete_event(self) -> None:
         """Mark event as completed"""
         self.status = "completed"
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, copy: bool = True) -> Dict[str, Any]:
         """
         Convert event to dictionary for serialization
         
+        Args:
+            copy (bool): Copy attendees into a list; when False they are a live keys view
+            
         Returns:
             dict: Event data as dictionary
         """
@@ -157,12 +252,51 @@ class Event:
             'location': self.location,
             'capacity': self.capacity,
             'organizer_id': self.organizer_id,
-            'attendees': self.attendees.copy(),
+            'attendees': list(self.attendees) if copy else self.attendees.keys(),
             'created_at': self.created_at,
             'updated_at': self.updated_at,
             'status': self.status
         }
     
+    def fill_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write the event's serialized fields into an existing dictionary
+        
+        Lets a caller reuse one scratch dict per record while streaming a save.
+        Like to_dict_view, the attendees entry is a live keys view, not a list.
+        
+        Args:
+            data (dict): Dictionary to overwrite
+            
+        Returns:
+            dict: The same dictionary, filled in
+        """
+        data['event_id'] = self.event_id
+        data['name'] = self.name
+        data['description'] = self.description
+        data['date'] = self.date
+        data['time'] = self.time
+        data['location'] = self.location
+        data['capacity'] = self.capacity
+        data['organizer_id'] = self.organizer_id
+        data['attendees'] = self.attendees.keys()
+        data['created_at'] = self.created_at
+        data['updated_at'] = self.updated_at
+        data['status'] = self.status
+        return data
+    
+    def to_dict_view(self) -> Dict[str, Any]:
+        """
+        Convert event to a dictionary without copying the attendees
+        
+        For read-only consumers such as the JSON writers, which encode the
+        attendees view as a list.
+        
+        Returns:
+            dict: Event data as dictionary
+        """
+        return self.to_dict(copy=False)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Event':
         """
@@ -181,34 +315,32 @@ class Event:
             time=data['time'],
             location=data['location'],
             capacity=data['capacity'],
-            organizer_id=data['organizer_id']
+            organizer_id=data['organizer_id'],
+            event_id=data['event_id']
         )
         
         # Set additional fields
-        event.event_id = data['event_id']
-        event.attendees = data.get('attendees', [])
-        event.created_at = data.get('created_at', datetime.now().isoformat())
-        event.updated_at = data.get('updated_at', datetime.now().isoformat())
+        event.attendees = dict.fromkeys(data.get('attendees', ()))
+        event.created_at = data['created_at'] if 'created_at' in data else _now_iso()
+        event.updated_at = data['updated_at'] if 'updated_at' in data else _now_iso()
         event.status = data.get('status', 'active')
         
         return event
     
     def __str__(self) -> str:
         """String representation of event"""
-        status_indicator = ""
-        if self.status == "cancelled":
-            status_indicator = " [CANCELLED]"
-        elif self.status == "completed":
-            status_indicator = " [COMPLETED]"
-        elif self.is_full():
-            status_indicator = " [FULL]"
+        status_indicator = _STATUS_SUFFIX.get(self.status)
+        if status_indicator is None:
+            status_indicator = " [FULL]" if self.is_full() else ""
         
-        return (f"Event: {self.name}{status_indicator}\n"
-                f"ID: {self.event_id}\n"
-                f"Description: {self.description}\n"
-                f"Date & Time: {self.date} at {self.time}\n"
-                f"Location: {self.location}\n"
-                f"Capacity: {len(self.attendees)}/{self.capacity}")
+        return "\n".join((
+            f"Event: {self.name}{status_indicator}",
+            f"ID: {self.event_id}",
+            f"Description: {self.description}",
+            f"Date & Time: {self.date} at {self.time}",
+            f"Location: {self.location}",
+            f"Capacity: {len(self.attendees)}/{self.capacity}"
+        ))
     
     def __repr__(self) -> str:
         """Developer representation of event"""
@@ -222,7 +354,10 @@ class Event:
     
     def __hash__(self) -> int:
         """Hash based on event ID"""
-        return hash(self.event_id)
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self.event_id)
+        return h
 
 
 class EventBuilder:
@@ -244,41 +379,52 @@ class EventBuilder:
     
     def name(self, name: str):
         """Set event name"""
-        self._name = name.strip()
+        self._name = name
         return self
     
     def description(self, description: str):
         """Set event description"""
-        self._description = description.strip()
+        self._description = description
         return self
     
     def date(self, date: str):
         """Set event date"""
-        self._date = date.strip()
+        self._date = date
         return self
     
     def time(self, time: str):
         """Set event time"""
-        self._time = time.strip()
+        self._time = time
         return self
     
     def location(self, location: str):
         """Set event location"""
-        self._location = location.strip()
+        self._location = location
         return self
     
     def capacity(self, capacity: int):
         """Set event capacity"""
-        self._capacity = max(1, capacity)
+        self._capacity = capacity
         return self
     
     def organizer(self, organizer_id: str):
         """Set organizer ID"""
-        self._organizer_id = organizer_id.strip()
+        self._organizer_id = organizer_id
         return self
     
+    def _validate_and_normalize(self) -> None:
+        """Strip text fields and clamp capacity once, right before building"""
+        self._name = self._name.strip()
+        self._description = self._description.strip()
+        self._date = self._date.strip()
+        self._time = self._time.strip()
+        self._location = self._location.strip()
+        self._organizer_id = self._organizer_id.strip()
+        self._capacity = max(1, self._capacity)
+    
     def build(self) -> Event:
         """Build and return the event"""
+        self._validate_and_normalize()
         if not all([self._name, self._date, self._time, self._location, 
                    self._organizer_id]) or self._capacity <= 0:
             raise ValueError("Missing required event fields")
@@ -304,7 +450,8 @@ def sort_events_by_date(events: List[Event], reverse: bool = False) -> List[Even
 
 def filter_upcoming_events(events: List[Event]) -> List[Event]:
     """Filter events to only include upcoming ones"""
-    return [event for event in events if event.is_upcoming() and event.status == "active"]
+    now = _now()
+    return [event for event in events if event.status == "active" and event.is_upcoming(now)]
 
 def filter_events_by_capacity(events: List[Event], min_available: int = 1) -> List[Event]:
     """Filter events by available capacity"""
@@ -312,19 +459,10 @@ def filter_events_by_capacity(events: List[Event], min_available: int = 1) -> Li
 
 def get_events_by_date_range(events: List[Event], start_date: str, end_date: str) -> List[Event]:
     """Get events within a date range"""
-    try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        
-        result = []
-        for event in events:
-            try:
-                event_date = datetime.strptime(event.date, "%Y-%m-%d")
-                if start <= event_date <= end:
-                    result.append(event)
-            except ValueError:
-                continue
-        
-        return result
-    except ValueError:
-        return []
\ No newline at end of file
+    start = _parse_date(start_date)
+    end = _parse_date(end_date)
+    if start is None or end is None:
+        return []
+    
+    return [event for event in events
+            if event._date_obj is not None and start <= event._date_obj <= end]
@@ -5,22 +5,50 @@ This module contains all user-related classes with role-based access control.
 Implements inheritance hierarchy for different user types.
 """
 
-import uuid
+import hashlib
 from datetime import datetime
 from abc import ABC, abstractmethod
+from .ids import fast_id
+
+class Perm:
+    """Capability bits; each user class carries its set in the PERMS class attribute"""
+    CREATE = 1
+    MANAGE_ALL = 2
+    VIEW_ALL = 4
+    MANAGE_USERS = 8
+    MANAGE_OWN = 16
+    REPORTS = 32
+
+_now = datetime.now
+
+
+def _now_iso():
+    """Current local time as an ISO 8601 string"""
+    return _now().isoformat()
+
 
 class User(ABC):
     """Abstract base class for all user types"""
     
-    def __init__(self, username, password, name, email):
-        """Initialize base user with common attributes"""
-        self.user_id = str(uuid.uuid4())
+    # Includes the bookkeeping UserController attaches
+    __slots__ = ('user_id', 'username', 'password', 'name', 'email', 'created_at',
+                 'registered_events', '_registration_listener', '_username_cf',
+                 '_email_cf', '_basic_info_cache')
+    
+    PERMS = 0
+    
+    def __init__(self, username, password, name, email, user_id=None):
+        """Initialize base user with common attributes; user_id is given when restoring a user"""
+        self.user_id = user_id if user_id is not None else fast_id()
         self.username = username
         self.password = password  # In production, this should be hashed
         self.name = name
         self.email = email
-        self.created_at = datetime.now().isoformat()
-        self.registered_events = []  # List of event IDs user is registered for
+        self.created_at = _now_iso()
+        self.registered_events = {}  # Insertion-ordered set of registered event IDs (values unused)
+        self._registration_listener = None  # Called as listener(user, delta) on registration changes
+        self._username_cf = self._email_cf = None  # Case-folded index keys, set by UserController
+        self._basic_info_cache = None
     
     @abstractmethod
     def get_role(self):
@@ -29,15 +57,15 @@ class User(ABC):
     
     def can_create_events(self):
         """Check if user can create events"""
-        return False
+        return bool(self.PERMS & Perm.CREATE)
     
     def can_manage_all_events(self):
         """Check if user can manage all events"""
-        return False
+        return bool(self.PERMS & Perm.MANAGE_ALL)
     
     def can_view_all_attendees(self):
         """Check if user can view all attendees"""
-        return False
+        return bool(self.PERMS & Perm.VIEW_ALL)
     
     def authenticate(self, password):
         """Authenticate user with password"""
@@ -46,14 +74,18 @@ class User(ABC):
     def add_registered_event(self, event_id):
         """Add event to user's registered events"""
         if event_id not in self.registered_events:
-            self.registered_events.append(event_id)
+            self.registered_events[event_id] = None
+            if self._registration_listener:
+                self._registration_listener(self, 1)
             return True
         return False
     
     def remove_registered_event(self, event_id):
         """Remove event from user's registered events"""
         if event_id in self.registered_events:
-            self.registered_events.remove(event_id)
+            del self.registered_events[event_id]
+            if self._registration_listener:
+                self._registration_listener(self, -1)
             return True
         return False
     
@@ -66,7 +98,7 @@ class User(ABC):
             'name': self.name,
             'email': self.email,
             'created_at': self.created_at,
-            'registered_events': self.registered_events,
+            'registered_events': list(self.registered_events),
             'user_type': self.get_role().lower().replace(' ', '_')
         }
     
@@ -83,20 +115,16 @@ class User(ABC):
 class Admin(User):
     """Administrator user with full system access"""
     
-    def __init__(self, username, password, name, email):
-        super().__init__(username, password, name, email)
-    
-    def get_role(self):
-        return "Admin"
+    __slots__ = ()
     
-    def can_create_events(self):
-        return True
+    PERMS = (Perm.CREATE | Perm.MANAGE_ALL | Perm.VIEW_ALL | Perm.MANAGE_USERS |
+             Perm.MANAGE_OWN | Perm.REPORTS)
     
-    def can_manage_all_events(self):
-        return True
+    def __init__(self, username, password, name, email, user_id=None):
+        super().__init__(username, password, name, email, user_id)
     
-    def can_view_all_attendees(self):
-        return True
+    def get_role(self):
+        return "Admin"
     
     def can_manage_users(self):
         return True
@@ -104,41 +132,42 @@ class Admin(User):
     @classmethod
     def from_dict(cls, data):
         """Create Admin instance from dictionary"""
-        admin = cls(data['username'], data['password'], data['name'], data['email'])
-        admin.user_id = data['user_id']
+        admin = cls(data['username'], data['password'], data['name'], data['email'],
+                    user_id=data['user_id'])
         admin.created_at = data['created_at']
-        admin.registered_events = data.get('registered_events', [])
+        admin.registered_events = dict.fromkeys(data.get('registered_events', ()))
         return admin
 
 
 class EventOrganizer(User):
     """Event organizer with event management capabilities"""
     
-    def __init__(self, username, password, name, email, department):
-        super().__init__(username, password, name, email)
+    __slots__ = ('department', 'organized_events')
+    
+    PERMS = Perm.CREATE | Perm.MANAGE_OWN
+    
+    def __init__(self, username, password, name, email, department, user_id=None):
+        super().__init__(username, password, name, email, user_id)
         self.department = department
-        self.organized_events = []  # List of event IDs organized by this user
+        self.organized_events = {}  # Insertion-ordered set of organized event IDs (values unused)
     
     def get_role(self):
         return "Event Organizer"
     
-    def can_create_events(self):
-        return True
-    
     def can_manage_own_events(self):
         return True
     
     def add_organized_event(self, event_id):
         """Add event to organizer's organized events"""
         if event_id not in self.organized_events:
-            self.organized_events.append(event_id)
+            self.organized_events[event_id] = None
             return True
         return False
     
     def remove_organized_event(self, event_id):
         """Remove event from organizer's organized events"""
         if event_id in self.organized_events:
-            self.organized_events.remove(event_id)
+            del self.organized_events[event_id]
             return True
         return False
     
@@ -147,7 +176,7 @@ class EventOrganizer(User):
         data = super().to_dict()
         data.update({
             'department': self.department,
-            'organized_events': self.organized_events
+            'organized_events': list(self.organized_events)
         })
         return data
     
@@ -155,19 +184,20 @@ class EventOrganizer(User):
     def from_dict(cls, data):
         """Create EventOrganizer instance from dictionary"""
         organizer = cls(data['username'], data['password'], data['name'], 
-                       data['email'], data['department'])
-        organizer.user_id = data['user_id']
+                       data['email'], data['department'], user_id=data['user_id'])
         organizer.created_at = data['created_at']
-        organizer.registered_events = data.get('registered_events', [])
-        organizer.organized_events = data.get('organized_events', [])
+        organizer.registered_events = dict.fromkeys(data.get('registered_events', ()))
+        organizer.organized_events = dict.fromkeys(data.get('organized_events', ()))
         return organizer
 
 
 class Student(User):
     """Student user with basic event access"""
     
-    def __init__(self, username, password, name, email, student_id):
-        super().__init__(username, password, name, email)
+    __slots__ = ('student_id',)
+    
+    def __init__(self, username, password, name, email, student_id, user_id=None):
+        super().__init__(username, password, name, email, user_id)
         self.student_id = student_id
     
     def get_role(self):
@@ -183,18 +213,19 @@ class Student(User):
     def from_dict(cls, data):
         """Create Student instance from dictionary"""
         student = cls(data['username'], data['password'], data['name'], 
-                     data['email'], data['student_id'])
-        student.user_id = data['user_id']
+                     data['email'], data['student_id'], user_id=data['user_id'])
         student.created_at = data['created_at']
-        student.registered_events = data.get('registered_events', [])
+        student.registered_events = dict.fromkeys(data.get('registered_events', ()))
         return student
 
 
 class Visitor(User):
     """Visitor user with basic event access"""
     
-    def __init__(self, username, password, name, email, organization=None):
-        super().__init__(username, password, name, email)
+    __slots__ = ('organization',)
+    
+    def __init__(self, username, password, name, email, organization=None, user_id=None):
+        super().__init__(username, password, name, email, user_id)
         self.organization = organization
     
     def get_role(self):
@@ -210,10 +241,9 @@ class Visitor(User):
     def from_dict(cls, data):
         """Create Visitor instance from dictionary"""
         visitor = cls(data['username'], data['password'], data['name'], 
-                     data['email'], data.get('organization'))
-        visitor.user_id = data['user_id']
+                     data['email'], data.get('organization'), user_id=data['user_id'])
         visitor.created_at = data['created_at']
-        visitor.registered_events = data.get('registered_events', [])
+        visitor.registered_events = dict.fromkeys(data.get('registered_events', ()))
         return visitor
 
 
@@ -223,14 +253,7 @@ class UserFactory:
     @staticmethod
     def create_user(user_type, **kwargs):
         """Create user instance based on type"""
-        user_types = {
-            'admin': Admin,
-            'event_organizer': EventOrganizer,
-            'student': Student,
-            'visitor': Visitor
-        }
-        
-        user_class = user_types.get(user_type.lower())
+        user_class = _USER_CLASSES.get(user_type.lower())
         if not user_class:
             raise ValueError(f"Unknown user type: {user_type}")
         
@@ -241,23 +264,27 @@ class UserFactory:
         """Create user instance from dictionary"""
         user_type = data.get('user_type')
         
-        if user_type == 'admin':
-            return Admin.from_dict(data)
-        elif user_type == 'event_organizer':
-            return EventOrganizer.from_dict(data)
-        elif user_type == 'student':
-            return Student.from_dict(data)
-        elif user_type == 'visitor':
-            return Visitor.from_dict(data)
-        else:
+        from_dict = _USER_FROM_DICT.get(user_type)
+        if from_dict is None:
             raise ValueError(f"Unknown user type: {user_type}")
+        return from_dict(data)
+
+
+# Dispatch tables for UserFactory, built once at import
+_USER_CLASSES = {
+    'admin': Admin,
+    'event_organizer': EventOrganizer,
+    'student': Student,
+    'visitor': Visitor
+}
+
+_USER_FROM_DICT = {user_type: cls.from_dict for user_type, cls in _USER_CLASSES.items()}
 
 
 # Utility functions for user management
 def hash_password(password):
     """Hash password for secure storage (simplified for demo)"""
     # In production, use proper hashing like bcrypt
-    import hashlib
     return hashlib.sha256(password.encode()).hexdigest()
 
 def verify_password(password, hashed):
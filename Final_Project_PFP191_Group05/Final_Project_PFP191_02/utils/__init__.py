@@ -1,4 +1,6 @@
 from .file_manager import FileManager
-from .validators import InputValidator
+# ValidationResult replaced the dicts the validators used to return and still
+# supports result['key'], result.get(key) and 'key' in result
+from .validators import InputValidator, ValidationResult
 
-__all__ = ['FileManager', 'InputValidator']
\ No newline at end of file
+__all__ = ['FileManager', 'InputValidator', 'ValidationResult']
\ No newline at end of file
@@ -7,12 +7,276 @@ Manages JSON and CSV file operations for events, users, and reports.
 
 import json
 import csv
+import gzip
+import heapq
+import mmap
 import os
 import tempfile
 import shutil
-from typing import List, Dict, Any, Optional
+import time
+from collections.abc import KeysView
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Iterable
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+try:
+    import orjson  # Optional C-accelerated JSON; the stdlib json module is the fallback
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the set-like containers models hand out without copying (e.g. attendees)"""
+    if isinstance(obj, (set, frozenset, KeysView)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Data files larger than this are memory-mapped instead of read into a buffer
+_MMAP_THRESHOLD = 1 << 16
+
+if orjson is not None:
+    def _encode_record(record: Dict[str, Any], pretty: bool = False) -> bytes:
+        """Encode one record as compact (or indented) UTF-8 JSON"""
+        if pretty:
+            return orjson.dumps(record, default=_json_default, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(record, default=_json_default)
+    
+    def _decode_file(f) -> Any:
+        """Decode a JSON document from a file opened in binary mode"""
+        if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        # Parse straight from the page cache rather than copying the file first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+else:
+    def _encode_record(record: Dict[str, Any], pretty: bool = False) -> bytes:
+        """Encode one record as compact (or indented) UTF-8 JSON"""
+        if pretty:
+            return json.dumps(record, indent=2, ensure_ascii=False,
+                              default=_json_default).encode('utf-8')
+        return json.dumps(record, separators=(',', ':'), ensure_ascii=False,
+                          default=_json_default).encode('utf-8')
+    
+    def _decode_file(f) -> Any:
+        """Decode a JSON document from a file opened in binary mode"""
+        return json.load(f)
+
+# Data files and CSV reports are written through one large buffer
+_WRITE_BUFFER = 1 << 20
+
+# CSV report headers
+ATTENDANCE_REPORT_HEADER = [
+    'Event ID', 'Event Name', 'Date', 'Time', 'Location',
+    'Organizer ID', 'Capacity', 'Registered', 'Available',
+    'Fill Rate (%)', 'Status'
+]
+
+EVENTS_REPORT_HEADER = [
+    'Event ID', 'Name', 'Description', 'Date', 'Time',
+    'Location', 'Capacity', 'Attendees', 'Organizer ID',
+    'Created At', 'Updated At', 'Status'
+]
+
+USERS_REPORT_HEADER = [
+    'User ID', 'Username', 'Name', 'Email', 'Role',
+    'Registered Events', 'Created At', 'Additional Info'
+]
+
+ATTENDEE_DETAILS_HEADER = [
+    'Event ID', 'Event Name', 'Event Date', 'Attendee ID',
+    'Attendee Name', 'Attendee Email', 'Attendee Role',
+    'Registration Date'
+]
+
+
+# Leading event columns of each report, fetched in one C-level call per row
+_attendance_fields = attrgetter('event_id', 'name', 'date', 'time',
+                                'location', 'organizer_id', 'capacity')
+_events_report_head = attrgetter('event_id', 'name', 'description',
+                                 'date', 'time', 'location', 'capacity')
+_events_report_tail = attrgetter('organizer_id', 'created_at', 'updated_at', 'status')
+
+
+def _attendance_row(event) -> list:
+    """Build one attendance report row for an event"""
+    capacity = event.capacity
+    registered = len(event.attendees)
+    fill_rate = (registered / capacity * 100) if capacity > 0 else 0
+    return [*_attendance_fields(event), registered, max(0, capacity - registered),
+            round(fill_rate, 2), event.status]
+
+
+def _events_report_row(event) -> list:
+    """Build one detailed events report row for an event"""
+    return [*_events_report_head(event), len(event.attendees), *_events_report_tail(event)]
+
+
+# Role -> (attribute, label) shown in the users report's Additional Info column
+_ROLE_INFO_FIELDS = {
+    "Student": ('student_id', "Student ID: "),
+    "Event Organizer": ('department', "Department: "),
+    "Visitor": ('organization', "Organization: "),
+}
+
+
+def _users_report_row(user) -> list:
+    """Build one users report row for a user"""
+    role = user.get_role()
+    additional_info = ""
+    info_field = _ROLE_INFO_FIELDS.get(role)
+    if info_field is not None:
+        value = getattr(user, info_field[0], "")
+        if value:
+            additional_info = f"{info_field[1]}{value}"
+    
+    return [
+        user.user_id, user.username, user.name, user.email,
+        role, len(user.registered_events),
+        user.created_at, additional_info
+    ]
+
+
+def _attendee_detail_rows(events, user_lookup: Dict[str, Any]) -> Iterable[tuple]:
+    """Yield one attendee details row per known attendee of each event"""
+    get_user = user_lookup.get
+    for event in events:
+        if not event.attendees:
+            continue
+        event_id, event_name, event_date = event.event_id, event.name, event.date
+        created_at = event.created_at  # Approximation of the registration date
+        for attendee_id in event.attendees:
+            user = get_user(attendee_id)
+            if user:
+                yield (event_id, event_name, event_date, attendee_id,
+                       user.name, user.email, user.get_role(), created_at)
+
+
+def _write_collection(f, key: str, records: Iterable[Dict[str, Any]],
+                      pretty: bool = False) -> None:
+    """
+    Stream a {key: [...], last_updated, version} document to an open file
+    
+    Records are encoded one at a time, so the whole collection is never held
+    in memory as a single list. The output is compact JSON, or matches
+    json.dump(..., indent=2) when pretty is set, encoded as UTF-8.
+    
+    Args:
+        f: Binary file opened for writing
+        key (str): Top-level key for the records ('events' or 'users')
+        records (Iterable[dict]): Records to write
+        pretty (bool): Indent the document for reading by hand
+    """
+    if not pretty:
+        f.write(('{' + json.dumps(key) + ':[').encode('utf-8'))
+        separator = b''
+        for record in records:
+            f.write(separator)
+            f.write(_encode_record(record))
+            separator = b','
+        f.write(('],"last_updated":' + json.dumps(datetime.now().isoformat()) +
+                 ',"version":"1.0"}').encode('utf-8'))
+        return
+    
+    f.write(('{\n  ' + json.dumps(key) + ': [').encode('utf-8'))
+    separator = b'\n    '
+    for record in records:
+        # Encoded strings never contain raw newlines, so re-indenting is safe
+        f.write(separator)
+        f.write(_encode_record(record, pretty=True).replace(b'\n', b'\n    '))
+        separator = b',\n    '
+    if separator != b'\n    ':
+        f.write(b'\n  ')
+    f.write(('],\n  "last_updated": ' + json.dumps(datetime.now().isoformat()) +
+             ',\n  "version": "1.0"\n}').encode('utf-8'))
+
+@contextmanager
+def _atomic_write(path: str):
+    """
+    Open a temporary file for binary writing and move it over path on success
+    
+    The target is replaced in one os.replace, so a crash mid-save leaves the
+    previous file intact instead of a truncated one.
+    
+    Args:
+        path (str): File to (re)write
+    """
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb', buffering=_WRITE_BUFFER) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+# Linux FICLONE ioctl: share the source's blocks instead of copying them
+_FICLONE = 0x40049409
+
+
+def _reflink(in_fd: int, out_fd: int) -> bool:
+    """Clone in_fd into out_fd on copy-on-write filesystems (btrfs, XFS)"""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(out_fd, _FICLONE, in_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _sendfile_copy(src: str, dst: str) -> None:
+    """
+    Copy a file by reflink or os.sendfile so the kernel moves the bytes, then copy metadata
+    
+    Falls back to shutil.copy2 where neither is available or the files are refused.
+    
+    Args:
+        src (str): File to copy
+        dst (str): Destination path
+    """
+    if not hasattr(os, 'sendfile'):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            remaining = 0 if _reflink(in_fd, out_fd) else os.fstat(in_fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+def _gzip_file(path: str) -> None:
+    """Replace a file with a gzip-compressed copy at path + '.gz'"""
+    archive = path + '.gz'
+    with open(path, 'rb') as src, gzip.open(archive, 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, _WRITE_BUFFER)
+    shutil.copystat(path, archive)
+    os.remove(path)
+
+
 class FileManager:
     """File manager for handling data persistence"""
     
@@ -27,9 +291,10 @@ class FileManager:
         self.events_file = os.path.join(data_dir, "events.json")
         self.users_file = os.path.join(data_dir, "users.json")
         self.reports_dir = os.path.join(data_dir, "reports")
-        
-        # Create directories if they don't exist
-        self._ensure_directories()
+        # Directories are created on the first save or export, not here, so a
+        # process that only loads data never touches the filesystem layout
+        self._dirs_ready = False  # set once the data and reports directories exist
+        self._loaded = {}  # path -> ((mtime_ns, size), records) from the last read
     
     def _ensure_directories(self) -> None:
         """Create necessary directories if they don't exist"""
@@ -44,6 +309,7 @@ class FileManager:
             
             # Tạo thư mục reports
             os.makedirs(self.reports_dir, exist_ok=True)
+            self._dirs_ready = True
             
         except PermissionError as e:
             print(f"Permission error creating directories: {e}")
@@ -65,6 +331,7 @@ class FileManager:
             
             # Retry creating directories
             os.makedirs(self.reports_dir, exist_ok=True)
+            self._dirs_ready = True
             print("Successfully created reports directory")
             
         except Exception as e:
@@ -86,6 +353,7 @@ class FileManager:
             
             os.makedirs(self.data_dir, exist_ok=True)
             os.makedirs(self.reports_dir, exist_ok=True)
+            self._dirs_ready = True
             print(f"Using alternative directory: {self.data_dir}")
             
         except Exception as e:
@@ -99,32 +367,34 @@ class FileManager:
                 os.makedirs(self.reports_dir, exist_ok=True)
             except:
                 self.reports_dir = "."
+            self._dirs_ready = True
             print(f"Using current directory as fallback")
     
-    def save_events(self, events_data: List[Dict[str, Any]]) -> bool:
+    def save_events(self, events_data: Iterable[Dict[str, Any]], pretty: bool = False) -> bool:
         """
         Save events data to JSON file
         
         Args:
-            events_data (List[dict]): List of event dictionaries
+            events_data (Iterable[dict]): Event dictionaries
+            pretty (bool): Write indented JSON for manual inspection instead of compact JSON
             
         Returns:
             bool: True if save successful
         """
+        # Materialized up front so the fallback location gets every record even
+        # if the primary write fails after consuming part of the input
+        records = list(events_data)
         try:
             # Ensure directory exists before saving
-            os.makedirs(os.path.dirname(self.events_file), exist_ok=True)
-            
-            with open(self.events_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'events': events_data,
-                    'last_updated': datetime.now().isoformat(),
-                    'version': '1.0'
-                }, f, indent=2, ensure_ascii=False)
+            if not self._dirs_ready:
+                self._ensure_directories()
+            
+            with _atomic_write(self.events_file) as f:
+                _write_collection(f, 'events', records, pretty)
             return True
         except PermissionError:
             print(f"Permission denied: Cannot write to {self.events_file}")
-            return self._save_to_alternative_location('events', events_data)
+            return self._save_to_alternative_location('events', records)
         except Exception as e:
             print(f"Error saving events: {e}")
             return False
@@ -141,11 +411,9 @@ class FileManager:
                 print(f"Events file not found: {self.events_file}")
                 return []
             
-            with open(self.events_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                events = data.get('events', [])
-                print(f"Loaded {len(events)} events from {self.events_file}")
-                return events
+            events = self._read_collection(self.events_file, 'events')
+            print(f"Loaded {len(events)} events from {self.events_file}")
+            return events
         except json.JSONDecodeError as e:
             print(f"Invalid JSON in events file: {e}")
             return []
@@ -156,30 +424,60 @@ class FileManager:
             print(f"Error loading events: {e}")
             return []
     
-    def save_users(self, users_data: List[Dict[str, Any]]) -> bool:
+    def _read_collection(self, path: str, key: str) -> List[Dict[str, Any]]:
+        """
+        Read the records stored under key in a JSON data file
+        
+        The parsed records are kept in memory together with the file's mtime
+        and size; later loads reuse them while both still match and skip JSON
+        parsing. Returned record dicts are shared with the in-memory cache and
+        should be treated as read-only.
+        
+        Args:
+            path (str): JSON file to read
+            key (str): Top-level key holding the records
+            
+        Returns:
+            List[dict]: Stored records
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        loaded = self._loaded.get(path)
+        if loaded is not None and loaded[0] == signature:
+            return list(loaded[1])
+        
+        with open(path, 'rb') as f:
+            records = _decode_file(f).get(key, [])
+        
+        self._loaded[path] = (signature, records)
+        return list(records)
+    
+    def save_users(self, users_data: Iterable[Dict[str, Any]], pretty: bool = False) -> bool:
         """
         Save users data to JSON file
         
         Args:
-            users_data (List[dict]): List of user dictionaries
+            users_data (Iterable[dict]): User dictionaries
+            pretty (bool): Write indented JSON for manual inspection instead of compact JSON
             
         Returns:
             bool: True if save successful
         """
+        # Materialized up front so the fallback location gets every record even
+        # if the primary write fails after consuming part of the input
+        records = list(users_data)
         try:
             # Ensure directory exists before saving
-            os.makedirs(os.path.dirname(self.users_file), exist_ok=True)
-            
-            with open(self.users_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'users': users_data,
-                    'last_updated': datetime.now().isoformat(),
-                    'version': '1.0'
-                }, f, indent=2, ensure_ascii=False)
+            if not self._dirs_ready:
+                self._ensure_directories()
+            
+            with _atomic_write(self.users_file) as f:
+                _write_collection(f, 'users', records, pretty)
             return True
         except PermissionError:
             print(f"Permission denied: Cannot write to {self.users_file}")
-            return self._save_to_alternative_location('users', users_data)
+            return self._save_to_alternative_location('users', records)
         except Exception as e:
             print(f"Error saving users: {e}")
             return False
@@ -196,11 +494,9 @@ class FileManager:
                 print(f"Users file not found: {self.users_file}")
                 return []
             
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                users = data.get('users', [])
-                print(f"Loaded {len(users)} users from {self.users_file}")
-                return users
+            users = self._read_collection(self.users_file, 'users')
+            print(f"Loaded {len(users)} users from {self.users_file}")
+            return users
         except json.JSONDecodeError as e:
             print(f"Invalid JSON in users file: {e}")
             return []
@@ -226,12 +522,8 @@ class FileManager:
             temp_dir = tempfile.gettempdir()
             alt_file = os.path.join(temp_dir, f"campus_{file_type}.json")
             
-            with open(alt_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    file_type: data,
-                    'last_updated': datetime.now().isoformat(),
-                    'version': '1.0'
-                }, f, indent=2, ensure_ascii=False)
+            with _atomic_write(alt_file) as f:
+                _write_collection(f, file_type, data)
             
             print(f"Data saved to alternative location: {alt_file}")
             return True
@@ -239,49 +531,30 @@ class FileManager:
             print(f"Failed to save to alternative location: {e}")
             return False
     
-    def export_attendance_report(self, events: List) -> bool:
+    def export_attendance_report(self, events: List, timestamp: Optional[str] = None) -> bool:
         """
         Export attendance report to CSV
         
         Args:
             events (List[Event]): List of event objects
+            timestamp (str, optional): Filename timestamp; defaults to now
             
         Returns:
             bool: True if export successful
         """
         try:
             # Ensure reports directory exists
-            os.makedirs(self.reports_dir, exist_ok=True)
+            if not self._dirs_ready:
+                self._ensure_directories()
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if timestamp is None:
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = os.path.join(self.reports_dir, f"attendance_report_{timestamp}.csv")
             
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
-                
-                # Write header
-                writer.writerow([
-                    'Event ID', 'Event Name', 'Date', 'Time', 'Location',
-                    'Organizer ID', 'Capacity', 'Registered', 'Available',
-                    'Fill Rate (%)', 'Status'
-                ])
-                
-                # Write data
-                for event in events:
-                    fill_rate = (len(event.attendees) / event.capacity * 100) if event.capacity > 0 else 0
-                    writer.writerow([
-                        event.event_id,
-                        event.name,
-                        event.date,
-                        event.time,
-                        event.location,
-                        event.organizer_id,
-                        event.capacity,
-                        len(event.attendees),
-                        event.get_available_spots(),
-                        round(fill_rate, 2),
-                        event.status
-                    ])
+                writer.writerow(ATTENDANCE_REPORT_HEADER)
+                writer.writerows(map(_attendance_row, events))
             
             print(f"Attendance report exported to: {filename}")
             return True
@@ -292,49 +565,30 @@ class FileManager:
             print(f"Error exporting attendance report: {e}")
             return False
     
-    def export_events_report(self, events: List) -> bool:
+    def export_events_report(self, events: List, timestamp: Optional[str] = None) -> bool:
         """
         Export detailed events report to CSV
         
         Args:
             events (List[Event]): List of event objects
+            timestamp (str, optional): Filename timestamp; defaults to now
             
         Returns:
             bool: True if export successful
         """
         try:
             # Ensure reports directory exists
-            os.makedirs(self.reports_dir, exist_ok=True)
+            if not self._dirs_ready:
+                self._ensure_directories()
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if timestamp is None:
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = os.path.join(self.reports_dir, f"events_report_{timestamp}.csv")
             
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
-                
-                # Write header
-                writer.writerow([
-                    'Event ID', 'Name', 'Description', 'Date', 'Time',
-                    'Location', 'Capacity', 'Attendees', 'Organizer ID',
-                    'Created At', 'Updated At', 'Status'
-                ])
-                
-                # Write data
-                for event in events:
-                    writer.writerow([
-                        event.event_id,
-                        event.name,
-                        event.description,
-                        event.date,
-                        event.time,
-                        event.location,
-                        event.capacity,
-                        len(event.attendees),
-                        event.organizer_id,
-                        event.created_at,
-                        event.updated_at,
-                        event.status
-                    ])
+                writer.writerow(EVENTS_REPORT_HEADER)
+                writer.writerows(map(_events_report_row, events))
             
             print(f"Events report exported to: {filename}")
             return True
@@ -345,6 +599,121 @@ class FileManager:
             print(f"Error exporting events report: {e}")
             return False
     
+    def export_event_reports(self, events: List, timestamp: Optional[str] = None) -> bool:
+        """
+        Export the attendance and detailed events reports in a single pass
+        
+        Args:
+            events (List[Event]): List of event objects
+            timestamp (str, optional): Filename timestamp; defaults to now
+            
+        Returns:
+            bool: True if both reports were exported
+        """
+        try:
+            # Ensure reports directory exists
+            if not self._dirs_ready:
+                self._ensure_directories()
+            
+            if timestamp is None:
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
+            attendance_file = os.path.join(self.reports_dir, f"attendance_report_{timestamp}.csv")
+            events_file = os.path.join(self.reports_dir, f"events_report_{timestamp}.csv")
+            
+            with open(attendance_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as fa, \
+                 open(events_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as fe:
+                attendance_writer = csv.writer(fa)
+                events_writer = csv.writer(fe)
+                attendance_writer.writerow(ATTENDANCE_REPORT_HEADER)
+                events_writer.writerow(EVENTS_REPORT_HEADER)
+                
+                for event in events:
+                    attendance_writer.writerow(_attendance_row(event))
+                    events_writer.writerow(_events_report_row(event))
+            
+            print(f"Attendance report exported to: {attendance_file}")
+            print(f"Events report exported to: {events_file}")
+            return True
+        except PermissionError:
+            print(f"Permission denied: Cannot write to {self.reports_dir}")
+            return (self._export_to_alternative_location('attendance', events) and
+                    self._export_to_alternative_location('events', events))
+        except Exception as e:
+            print(f"Error exporting event reports: {e}")
+            return False
+    
+    def save_and_export(self, events: List, users_data: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Save events and users and export both event reports, visiting each event once
+        
+        Every event is serialized to events.json and written to the attendance
+        and events CSVs in the same iteration.
+        
+        Args:
+            events (List[Event]): List of event objects
+            users_data (Iterable[dict]): User dictionaries to save
+            
+        Returns:
+            bool: True if all files were written
+        """
+        # Materialized once: the fallback path below may need to write it again
+        users_data = list(users_data)
+        report_files = []
+        try:
+            if not self._dirs_ready:
+                self._ensure_directories()
+            
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            attendance_file = os.path.join(self.reports_dir, f"attendance_report_{timestamp}.csv")
+            events_file = os.path.join(self.reports_dir, f"events_report_{timestamp}.csv")
+            report_files = [attendance_file, events_file]
+            
+            with _atomic_write(self.events_file) as fj, \
+                 open(attendance_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as fa, \
+                 open(events_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as fe:
+                attendance_writer = csv.writer(fa)
+                events_writer = csv.writer(fe)
+                attendance_writer.writerow(ATTENDANCE_REPORT_HEADER)
+                events_writer.writerow(EVENTS_REPORT_HEADER)
+                
+                def rows():
+                    scratch = {}
+                    for event in events:
+                        attendance_writer.writerow(_attendance_row(event))
+                        events_writer.writerow(_events_report_row(event))
+                        yield event.fill_dict(scratch)
+                
+                _write_collection(fj, 'events', rows())
+            
+            print(f"Attendance report exported to: {attendance_file}")
+            print(f"Events report exported to: {events_file}")
+        except PermissionError:
+            self._remove_partial_files(report_files)
+            # Fall back to the individual writers, each with its own alternative location
+            print(f"Permission denied: Cannot write to {self.data_dir}")
+            return (self.save_events(event.to_dict_view() for event in events) and
+                    self.save_users(users_data) and
+                    self.export_event_reports(events))
+        except Exception as e:
+            self._remove_partial_files(report_files)
+            print(f"Error saving and exporting data: {e}")
+            return False
+        
+        return self.save_users(users_data)
+    
+    def _remove_partial_files(self, paths: List[str]) -> None:
+        """
+        Remove files left half-written by a failed save_and_export
+        
+        Args:
+            paths (List[str]): Files to remove if they exist
+        """
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def _export_to_alternative_location(self, report_type: str, data: List) -> bool:
         """
         Export to alternative location when primary fails
@@ -358,40 +727,18 @@ class FileManager:
         """
         try:
             temp_dir = tempfile.gettempdir()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             alt_file = os.path.join(temp_dir, f"{report_type}_report_{timestamp}.csv")
             
-            with open(alt_file, 'w', newline='', encoding='utf-8') as f:
+            with open(alt_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
                 
                 if report_type == 'attendance':
-                    writer.writerow([
-                        'Event ID', 'Event Name', 'Date', 'Time', 'Location',
-                        'Organizer ID', 'Capacity', 'Registered', 'Available',
-                        'Fill Rate (%)', 'Status'
-                    ])
-                    for event in data:
-                        fill_rate = (len(event.attendees) / event.capacity * 100) if event.capacity > 0 else 0
-                        writer.writerow([
-                            event.event_id, event.name, event.date, event.time,
-                            event.location, event.organizer_id, event.capacity,
-                            len(event.attendees), event.get_available_spots(),
-                            round(fill_rate, 2), event.status
-                        ])
+                    writer.writerow(ATTENDANCE_REPORT_HEADER)
+                    writer.writerows(map(_attendance_row, data))
                 elif report_type == 'events':
-                    writer.writerow([
-                        'Event ID', 'Name', 'Description', 'Date', 'Time',
-                        'Location', 'Capacity', 'Attendees', 'Organizer ID',
-                        'Created At', 'Updated At', 'Status'
-                    ])
-                    for event in data:
-                        writer.writerow([
-                            event.event_id, event.name, event.description,
-                            event.date, event.time, event.location,
-                            event.capacity, len(event.attendees),
-                            event.organizer_id, event.created_at,
-                            event.updated_at, event.status
-                        ])
+                    writer.writerow(EVENTS_REPORT_HEADER)
+                    writer.writerows(map(_events_report_row, data))
             
             print(f"Report exported to alternative location: {alt_file}")
             return True
@@ -399,52 +746,30 @@ class FileManager:
             print(f"Failed to export to alternative location: {e}")
             return False
     
-    def export_users_report(self, users: List) -> bool:
+    def export_users_report(self, users: List, timestamp: Optional[str] = None) -> bool:
         """
         Export users report to CSV
         
         Args:
             users (List[User]): List of user objects
+            timestamp (str, optional): Filename timestamp; defaults to now
             
         Returns:
             bool: True if export successful
         """
         try:
             # Ensure reports directory exists
-            os.makedirs(self.reports_dir, exist_ok=True)
+            if not self._dirs_ready:
+                self._ensure_directories()
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if timestamp is None:
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = os.path.join(self.reports_dir, f"users_report_{timestamp}.csv")
             
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
-                
-                # Write header
-                writer.writerow([
-                    'User ID', 'Username', 'Name', 'Email', 'Role',
-                    'Registered Events', 'Created At', 'Additional Info'
-                ])
-                
-                # Write data
-                for user in users:
-                    additional_info = ""
-                    if hasattr(user, 'student_id'):
-                        additional_info = f"Student ID: {user.student_id}"
-                    elif hasattr(user, 'department'):
-                        additional_info = f"Department: {user.department}"
-                    elif hasattr(user, 'organization') and user.organization:
-                        additional_info = f"Organization: {user.organization}"
-                    
-                    writer.writerow([
-                        user.user_id,
-                        user.username,
-                        user.name,
-                        user.email,
-                        user.get_role(),
-                        len(user.registered_events),
-                        user.created_at,
-                        additional_info
-                    ])
+                writer.writerow(USERS_REPORT_HEADER)
+                writer.writerows(map(_users_report_row, users))
             
             print(f"Users report exported to: {filename}")
             return True
@@ -452,52 +777,35 @@ class FileManager:
             print(f"Error exporting users report: {e}")
             return False
     
-    def export_attendee_details(self, events: List, users: List) -> bool:
+    def export_attendee_details(self, events: List, users: List, timestamp: Optional[str] = None) -> bool:
         """
         Export detailed attendee information to CSV
         
         Args:
             events (List[Event]): List of event objects
             users (List[User]): List of user objects
+            timestamp (str, optional): Filename timestamp; defaults to now
             
         Returns:
             bool: True if export successful
         """
         try:
             # Ensure reports directory exists
-            os.makedirs(self.reports_dir, exist_ok=True)
+            if not self._dirs_ready:
+                self._ensure_directories()
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if timestamp is None:
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = os.path.join(self.reports_dir, f"attendee_details_{timestamp}.csv")
             
-            # Create user lookup dictionary
-            user_lookup = {user.user_id: user for user in users}
+            # Look up only the users that actually attend something
+            needed_ids = {attendee_id for event in events for attendee_id in event.attendees}
+            user_lookup = {user.user_id: user for user in users if user.user_id in needed_ids}
             
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
-                
-                # Write header
-                writer.writerow([
-                    'Event ID', 'Event Name', 'Event Date', 'Attendee ID',
-                    'Attendee Name', 'Attendee Email', 'Attendee Role',
-                    'Registration Date'
-                ])
-                
-                # Write data
-                for event in events:
-                    for attendee_id in event.attendees:
-                        user = user_lookup.get(attendee_id)
-                        if user:
-                            writer.writerow([
-                                event.event_id,
-                                event.name,
-                                event.date,
-                                attendee_id,
-                                user.name,
-                                user.email,
-                                user.get_role(),
-                                event.created_at  # Approximation
-                            ])
+                writer.writerow(ATTENDEE_DETAILS_HEADER)
+                writer.writerows(_attendee_detail_rows(events, user_lookup))
             
             print(f"Attendee details exported to: {filename}")
             return True
@@ -514,21 +822,21 @@ class FileManager:
         """
         try:
             backup_dir = os.path.join(self.data_dir, "backups")
-            os.makedirs(backup_dir, exist_ok=True)
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # makedirs creates the backups directory along with the subdirectory
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             backup_subdir = os.path.join(backup_dir, f"backup_{timestamp}")
             os.makedirs(backup_subdir, exist_ok=True)
             
             # Copy events file
             if os.path.exists(self.events_file):
-                shutil.copy2(self.events_file, 
-                           os.path.join(backup_subdir, "events.json"))
+                _sendfile_copy(self.events_file,
+                               os.path.join(backup_subdir, "events.json"))
             
             # Copy users file
             if os.path.exists(self.users_file):
-                shutil.copy2(self.users_file, 
-                           os.path.join(backup_subdir, "users.json"))
+                _sendfile_copy(self.users_file,
+                               os.path.join(backup_subdir, "users.json"))
             
             print(f"Backup created in: {backup_subdir}")
             return True
@@ -581,72 +889,89 @@ class FileManager:
         }
         
         try:
-            # Check events file
-            if os.path.exists(self.events_file):
-                stat = os.stat(self.events_file)
-                info['files']['events'] = {
-                    'path': self.events_file,
-                    'size_bytes': stat.st_size,
-                    'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                }
-            
-            # Check users file
-            if os.path.exists(self.users_file):
-                stat = os.stat(self.users_file)
-                info['files']['users'] = {
-                    'path': self.users_file,
+            # Check the events and users files with one stat call each
+            for name, path in (('events', self.events_file), ('users', self.users_file)):
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                info['files'][name] = {
+                    'path': path,
                     'size_bytes': stat.st_size,
                     'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
                 }
             
             # Check reports directory
-            if os.path.exists(self.reports_dir):
-                reports = os.listdir(self.reports_dir)
+            if os.path.isdir(self.reports_dir):
+                # One scandir pass; DirEntry.stat() reuses the directory read where it can
+                with os.scandir(self.reports_dir) as it:
+                    reports = [(entry.stat().st_mtime, entry.name) for entry in it]
                 info['files']['reports_count'] = len(reports)
-                info['files']['latest_reports'] = reports[-5:] if reports else []
+                # Newest five, listed oldest first, without sorting the whole directory
+                info['files']['latest_reports'] = [name for _, name in sorted(heapq.nlargest(5, reports))]
         except Exception as e:
             print(f"Error getting file info: {e}")
         
         return info
     
-    def cleanup_old_reports(self, days_old: int = 30) -> int:
+    def cleanup_old_reports(self, days_old: int = 30, archive_days: int = 365) -> int:
         """
         Clean up old report files
         
+        Reports older than days_old are gzip-compressed in place so they stay
+        available for auditing; compressed reports are removed once they are
+        older than archive_days. Both ages are measured from the report's
+        modification time, which the archive keeps.
+        
         Args:
-            days_old (int): Remove files older than this many days
+            days_old (int): Compress reports older than this many days
+            archive_days (int): Remove compressed reports older than this many days
             
         Returns:
-            int: Number of files removed
+            int: Number of old reports cleaned up (compressed), as before when
+            they were deleted; archives removed for age are printed but not counted
         """
         try:
-            removed_count = 0
-            current_time = datetime.now()
+            cleaned_count = 0
+            removed_archives = 0
             
             if not os.path.exists(self.reports_dir):
                 return 0
             
-            for filename in os.listdir(self.reports_dir):
-                file_path = os.path.join(self.reports_dir, filename)
-                
-                if os.path.isfile(file_path):
-                    file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                    age_days = (current_time - file_time).days
-                    
-                    if age_days > days_old:
-                        os.remove(file_path)
-                        removed_count += 1
-            
-            print(f"Removed {removed_count} old report files")
-            return removed_count
+            # A file is handled once it is more than the given whole days old
+            now = time.time()
+            compress_cutoff = now - (days_old + 1) * 86400
+            remove_cutoff = now - (archive_days + 1) * 86400
+            
+            # Snapshot the listing first; the archives created below must not
+            # show up in the same scan
+            with os.scandir(self.reports_dir) as it:
+                entries = [entry for entry in it if entry.is_file()]
+            
+            for entry in entries:
+                mtime = entry.stat().st_mtime
+                if entry.name.endswith('.gz'):
+                    if mtime <= remove_cutoff:
+                        os.remove(entry.path)
+                        removed_archives += 1
+                elif mtime <= compress_cutoff:
+                    _gzip_file(entry.path)
+                    cleaned_count += 1
+            
+            print(f"Archived {cleaned_count} old report files, removed {removed_archives} expired archives")
+            return cleaned_count
         except Exception as e:
             print(f"Error cleaning up reports: {e}")
             return 0
     
-    def test_permissions(self) -> Dict[str, bool]:
+    def test_permissions(self, deep: bool = False) -> Dict[str, bool]:
         """
         Test file system permissions
         
+        Args:
+            deep (bool): Write and delete a probe file in each directory instead
+                of trusting os.access (which can miss ACLs on network filesystems)
+        
         Returns:
             dict: Permission test results
         """
@@ -657,32 +982,30 @@ class FileManager:
             'users_file_writable': False
         }
         
-        try:
-            # Test data directory
-            test_file = os.path.join(self.data_dir, 'test_write.tmp')
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
-            results['data_dir_writable'] = True
-        except:
-            pass
+        if not self._dirs_ready:
+            self._ensure_directories()
         
-        try:
-            # Test reports directory
-            test_file = os.path.join(self.reports_dir, 'test_write.tmp')
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
-            results['reports_dir_writable'] = True
-        except:
-            pass
+        # Test data and reports directories
+        for result_key, directory in (('data_dir_writable', self.data_dir),
+                                      ('reports_dir_writable', self.reports_dir)):
+            if not deep:
+                results[result_key] = os.access(directory, os.W_OK)
+                continue
+            try:
+                test_file = os.path.join(directory, 'test_write.tmp')
+                with open(test_file, 'w') as f:
+                    f.write('test')
+                os.remove(test_file)
+                results[result_key] = True
+            except:
+                pass
         
         try:
             # Test events file
             if os.path.exists(self.events_file):
                 results['events_file_writable'] = os.access(self.events_file, os.W_OK)
             else:
-                results['events_file_writable'] = os.access(os.path.dirname(self.events_file), os.W_OK)
+                results['events_file_writable'] = os.access(os.path.dirname(self.events_file) or '.', os.W_OK)
         except:
             pass
         
@@ -691,7 +1014,7 @@ class FileManager:
             if os.path.exists(self.users_file):
                 results['users_file_writable'] = os.access(self.users_file, os.W_OK)
             else:
-                results['users_file_writable'] = os.access(os.path.dirname(self.users_file), os.W_OK)
+                results['users_file_writable'] = os.access(os.path.dirname(self.users_file) or '.', os.W_OK)
         except:
             pass
         
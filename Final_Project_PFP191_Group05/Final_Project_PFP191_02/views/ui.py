@@ -6,91 +6,357 @@ Provides console-based interface for the Campus Event Management System.
 """
 
 import os
+import shutil
+import sys
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import zip_longest
 from typing import List, Dict, Any
 
+# Minimum seconds between progress bar redraws (~30 Hz)
+_PROGRESS_INTERVAL = 0.033
+
+# ANSI escape: erase the display and move the cursor home
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+_YES_ANSWERS = frozenset(('y', 'yes'))
+
+# Event blocks buffered per write when listing events
+_EVENTS_PER_WRITE = 64
+
+# Master rule strings; sliced instead of multiplying a character on every call
+_EQUALS = "=" * 256
+_DASHES = "-" * 256
+_BAR_FILLED = "█" * 40
+_BOX_RULE = "─" * 78  # create_box is at most 80 columns wide
+
+
+def _rule(master: str, length: int) -> str:
+    """Get a rule of the given length, sliced from a master rule string when it is long enough"""
+    if 0 <= length <= len(master):
+        return master[:length]
+    return master[0] * length
+
+
+def _render(lines: List[str]) -> str:
+    """Join display lines into a newline-terminated block"""
+    return "\n".join(lines) + "\n"
+
+
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+
+@lru_cache(maxsize=256)
+def _display_key(key: str) -> str:
+    """Turn a statistics key such as 'total_events' into 'Total Events'"""
+    return key.translate(_UNDERSCORE_TO_SPACE).title()
+
+
+@lru_cache(maxsize=512)
+def _format_datetime(datetime_str: str) -> str:
+    """Format an ISO datetime string, returning it unchanged if it does not parse"""
+    try:
+        dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+    except ValueError:
+        return datetime_str
+    return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Help text per topic, shown between the help title and the closing separator
+_HELP_TOPICS = {
+    'general': _render([
+        "Campus Event Management System Help",
+        "",
+        "This system allows you to:",
+        "• Search for campus events",
+        "• Register for events",
+        "• Manage your event registrations",
+        "• Create and organize events (with proper permissions)",
+        "",
+        "Navigation:",
+        "• Use numeric menu choices",
+        "• Follow prompts for input",
+        "• Press Ctrl+C to cancel operations",
+    ]),
+    'search': _render([
+        "Event Search Help",
+        "",
+        "You can search for events by:",
+        "• Event name (partial matches allowed)",
+        "• Date (YYYY-MM-DD format)",
+        "• Location (partial matches allowed)",
+        "",
+        "Examples:",
+        "• Search by name: 'conference' finds 'Tech Conference'",
+        "• Search by date: '2025-08-15'",
+        "• Search by location: 'hall' finds 'Main Hall'",
+    ]),
+    'registration': _render([
+        "Event Registration Help",
+        "",
+        "To register for an event:",
+        "1. Search for events",
+        "2. Note the Event ID",
+        "3. Use 'Register for Event' option",
+        "4. Enter the Event ID",
+        "",
+        "Notes:",
+        "• You cannot register for full events",
+        "• You cannot register for past events",
+        "• You cannot register twice for the same event",
+    ]),
+}
+
+_EXPORT_SUCCESS_TEMPLATE = (
+    "\n📁 Export successful!\n"
+    "File saved as: {filename}\n"
+    "You can open this file with spreadsheet software.\n"
+)
+
+_IMPORT_RESULTS_TEMPLATE = (
+    "\n📥 Import Results\n{separator}\n"
+    "✅ Successfully imported: {success}\n"
+    "❌ Failed to import: {failed}\n"
+    "⚠️  Duplicates skipped: {duplicates}\n"
+    "{sub_separator}\n"
+)
+
+# Profile format strings per user class, built on first use by _profile_template
+_PROFILE_TEMPLATES: Dict[type, str] = {}
+
+_PROFILE_HEAD = (
+    "\n👤 User Profile\n{separator}\n"
+    "Name: {user.name}\nUsername: {user.username}\nEmail: {user.email}\n"
+    "Role: {role}\nRegistered Events: {registered}\n"
+)
+_PROFILE_TAIL = "Member Since: {member_since}\n{sub_separator}\n"
+
+
+def _profile_template(user) -> str:
+    """Get the profile format string for a user's class, resolving its role fields once"""
+    user_type = type(user)
+    template = _PROFILE_TEMPLATES.get(user_type)
+    if template is None:
+        if hasattr(user, 'student_id'):
+            role_fields = "Student ID: {user.student_id}\n"
+        elif hasattr(user, 'department'):
+            role_fields = "Department: {user.department}\n"
+            if hasattr(user, 'organized_events'):
+                role_fields += "Organized Events: {organized}\n"
+        elif hasattr(user, 'organization'):
+            role_fields = "{organization}"  # Only shown when set
+        else:
+            role_fields = ""
+        template = _PROFILE_TEMPLATES[user_type] = _PROFILE_HEAD + role_fields + _PROFILE_TAIL
+    return template
+
+
+@lru_cache(maxsize=1024)
+def _render_summary_with_attendees(name, event_id, description, date, start_time, location,
+                                   capacity, attendee_count, status, sub_separator) -> str:
+    """Render an event summary block showing attendance; unchanged events hit the cache"""
+    fill_rate = (attendee_count * 100.0 / capacity) if capacity > 0 else 0
+    return (
+        f"📅 {name}\n   ID: {event_id}\n   📝 {description}\n"
+        f"   📅 {date} at {start_time}\n   📍 {location}\n"
+        f"   👥 {attendee_count}/{capacity} attendees ({fill_rate:.1f}% full)\n"
+        f"   ⭐ Status: {status.title()}\n{sub_separator}\n"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _render_summary_available(name, event_id, description, date, start_time, location,
+                              capacity, attendee_count, status, sub_separator) -> str:
+    """Render an event summary block showing open spots; unchanged events hit the cache"""
+    available = capacity - attendee_count
+    status_text = "Available" if available > 0 else "Full"
+    return (
+        f"📅 {name}\n   ID: {event_id}\n   📝 {description}\n"
+        f"   📅 {date} at {start_time}\n   📍 {location}\n"
+        f"   🎫 {available} spots available ({status_text})\n"
+        f"   ⭐ Status: {status.title()}\n{sub_separator}\n"
+    )
+
 class UI:
     """User Interface class for console-based interactions"""
     
     def __init__(self):
         """Initialize UI with display settings"""
-        self.width = 80
-        self.separator = "=" * self.width
-        self.sub_separator = "-" * self.width
+        self._set_width(shutil.get_terminal_size((80, 24)).columns)
+        self._last_progress = None
+        
+        # Clear with an ANSI escape on capable terminals instead of spawning a shell
+        self._ansi_clear = sys.stdout.isatty() and os.environ.get('TERM') != 'dumb'
+        if self._ansi_clear and os.name == 'nt':
+            os.system('')  # Enables VT escape processing in the Windows console
+    
+    def _set_width(self, width: int):
+        """
+        Set the display width and rebuild everything derived from it
+        
+        Args:
+            width (int): Terminal width in columns
+        """
+        self.width = width
+        self.separator = _rule(_EQUALS, self.width)
+        self.sub_separator = _rule(_DASHES, self.width)
+        
+        # Static screens are rendered once and written as-is on every call
+        rule_30 = _EQUALS[:30]
+        rule_40 = _EQUALS[:40]
+        self._welcome_screen = _render([
+            self.separator,
+            " " * 15 + "🎓 CAMPUS EVENT MANAGEMENT SYSTEM 🎓",
+            self.separator,
+            "",
+            "Welcome to the Campus Event Management System!",
+            "This system helps manage campus events with role-based access control.",
+            "",
+            "Features:",
+            "• Event creation and management",
+            "• User registration and authentication",
+            "• Capacity management and tracking",
+            "• Comprehensive reporting system",
+            "• Role-based access control",
+            "",
+            self.sub_separator,
+            "",
+        ])
+        self._auth_menu = _render([
+            "\n" + rule_30,
+            "     AUTHENTICATION MENU",
+            rule_30,
+            "1. Login",
+            "2. Register New Account",
+            "3. Exit System",
+            self.sub_separator,
+        ])
+        self._admin_menu = _render([
+            "\n" + rule_40,
+            "         ADMINISTRATOR MENU",
+            rule_40,
+            "1. Create New Event",
+            "2. View All Events",
+            "3. Update Event",
+            "4. Delete Event",
+            "5. View All Attendees",
+            "6. Generate Reports",
+            "7. User Management",
+            "8. Logout",
+            self.sub_separator,
+        ])
+        self._organizer_menu = _render([
+            "\n" + rule_40,
+            "       EVENT ORGANIZER MENU",
+            rule_40,
+            "1. Create New Event",
+            "2. View My Events",
+            "3. Manage Event Attendees",
+            "4. Update My Event",
+            "5. View Event Statistics",
+            "6. Logout",
+            self.sub_separator,
+        ])
+        self._user_menu = _render([
+            "\n" + rule_40,
+            "           USER MENU",
+            rule_40,
+            "1. Search Events",
+            "2. Register for Event",
+            "3. View My Registrations",
+            "4. Unregister from Event",
+            "5. Logout",
+            self.sub_separator,
+        ])
+        self._footer = _render([
+            "\n" + self.sub_separator,
+            "Campus Event Management System © 2025",
+            "For support, contact: admin@campus.edu",
+            self.sub_separator,
+        ])
+        self._system_info_head = _render([
+            f"\n🖥️  System Information",
+            self.separator,
+            "Campus Event Management System v1.0",
+            "Developed with Python",
+            "Features: Role-based access, Event management, Reporting",
+        ])
+        self._sub_separator_line = self.sub_separator + "\n"
+        self._static_bytes = {}
+    
+    def _refresh_width(self):
+        """Re-read the terminal width before a render, rebuilding only if it changed"""
+        columns = shutil.get_terminal_size((self.width, 24)).columns
+        if columns != self.width:
+            self._set_width(columns)
+    
+    def _write(self, lines: List[str]):
+        """
+        Write a batch of display lines to stdout in a single call
+        
+        Args:
+            lines (List[str]): Lines to write, without trailing newlines
+        """
+        sys.stdout.write(_render(lines))
+    
+    def _write_static(self, text: str):
+        """
+        Write a prebuilt screen, bypassing text encoding when stdout is UTF-8
+        
+        Args:
+            text (str): Rendered screen text
+        """
+        stream = sys.stdout
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is None or (stream.encoding or '').lower() not in ('utf-8', 'utf8'):
+            stream.write(text)
+            return
+        
+        data = self._static_bytes.get(text)
+        if data is None:
+            data = self._static_bytes[text] = text.replace('\n', os.linesep).encode('utf-8')
+        
+        stream.flush()  # Keep ordering with anything still in the text layer
+        buffer.write(data)
+        buffer.flush()
     
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._ansi_clear:
+            sys.stdout.write(_CLEAR_SCREEN)
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     def display_welcome(self):
         """Display welcome screen"""
+        self._refresh_width()
+        if self._ansi_clear:
+            # Clear and redraw in one write so the terminal updates in a single pass
+            self._write_static(_CLEAR_SCREEN + self._welcome_screen)
+            return
         self.clear_screen()
-        print(self.separator)
-        print(" " * 15 + "🎓 CAMPUS EVENT MANAGEMENT SYSTEM 🎓")
-        print(self.separator)
-        print()
-        print("Welcome to the Campus Event Management System!")
-        print("This system helps manage campus events with role-based access control.")
-        print()
-        print("Features:")
-        print("• Event creation and management")
-        print("• User registration and authentication")
-        print("• Capacity management and tracking")
-        print("• Comprehensive reporting system")
-        print("• Role-based access control")
-        print()
-        print(self.sub_separator)
-        print()
+        self._write_static(self._welcome_screen)
     
     def display_auth_menu(self):
         """Display authentication menu"""
-        print("\n" + "=" * 30)
-        print("     AUTHENTICATION MENU")
-        print("=" * 30)
-        print("1. Login")
-        print("2. Register New Account")
-        print("3. Exit System")
-        print(self.sub_separator)
+        self._refresh_width()
+        self._write_static(self._auth_menu)
     
     def display_admin_menu(self):
         """Display admin menu"""
-        print("\n" + "=" * 40)
-        print("         ADMINISTRATOR MENU")
-        print("=" * 40)
-        print("1. Create New Event")
-        print("2. View All Events")
-        print("3. Update Event")
-        print("4. Delete Event")
-        print("5. View All Attendees")
-        print("6. Generate Reports")
-        print("7. User Management")
-        print("8. Logout")
-        print(self.sub_separator)
+        self._refresh_width()
+        self._write_static(self._admin_menu)
     
     def display_organizer_menu(self):
         """Display event organizer menu"""
-        print("\n" + "=" * 40)
-        print("       EVENT ORGANIZER MENU")
-        print("=" * 40)
-        print("1. Create New Event")
-        print("2. View My Events")
-        print("3. Manage Event Attendees")
-        print("4. Update My Event")
-        print("5. View Event Statistics")
-        print("6. Logout")
-        print(self.sub_separator)
+        self._refresh_width()
+        self._write_static(self._organizer_menu)
     
     def display_user_menu(self):
         """Display student/visitor menu"""
-        print("\n" + "=" * 40)
-        print("           USER MENU")
-        print("=" * 40)
-        print("1. Search Events")
-        print("2. Register for Event")
-        print("3. View My Registrations")
-        print("4. Unregister from Event")
-        print("5. Logout")
-        print(self.sub_separator)
+        self._refresh_width()
+        self._write_static(self._user_menu)
     
     def display_event_summary(self, event, show_attendees=False):
         """
@@ -100,22 +366,41 @@ class UI:
             event: Event object to display
             show_attendees (bool): Whether to show attendee count
         """
-        print(f"\n📅 {event.name}")
-        print(f"   ID: {event.event_id}")
-        print(f"   📝 {event.description}")
-        print(f"   📅 {event.date} at {event.time}")
-        print(f"   📍 {event.location}")
+        self._refresh_width()
+        summary = self._summary_with_attendees if show_attendees else self._summary_available
+        sys.stdout.write("\n" + summary(event))
+    
+    def _summary_with_attendees(self, event) -> str:
+        """
+        Get the rendered summary block for an event, with its attendance
         
-        if show_attendees:
-            fill_rate = (len(event.attendees) / event.capacity * 100) if event.capacity > 0 else 0
-            print(f"   👥 {len(event.attendees)}/{event.capacity} attendees ({fill_rate:.1f}% full)")
-        else:
-            available = event.capacity - len(event.attendees)
-            status = "Available" if available > 0 else "Full"
-            print(f"   🎫 {available} spots available ({status})")
+        Args:
+            event: Event object to display
+            
+        Returns:
+            str: Summary lines, cached on every field that appears in them
+        """
+        return _render_summary_with_attendees(
+            event.name, event.event_id, event.description, event.date, event.time,
+            event.location, event.capacity, len(event.attendees), event.status,
+            self.sub_separator
+        )
+    
+    def _summary_available(self, event) -> str:
+        """
+        Get the rendered summary block for an event, with its open spots
         
-        print(f"   ⭐ Status: {event.status.title()}")
-        print(self.sub_separator)
+        Args:
+            event: Event object to display
+            
+        Returns:
+            str: Summary lines, cached on every field that appears in them
+        """
+        return _render_summary_available(
+            event.name, event.event_id, event.description, event.date, event.time,
+            event.location, event.capacity, len(event.attendees), event.status,
+            self.sub_separator
+        )
     
     def display_events_list(self, events: List, title: str = "Events", show_attendees: bool = False):
         """
@@ -126,16 +411,39 @@ class UI:
             title (str): Title for the list
             show_attendees (bool): Whether to show attendee information
         """
-        print(f"\n{title} ({len(events)} found)")
-        print(self.separator)
+        self._refresh_width()
+        lines = [f"\n{title} ({len(events)} found)", self.separator]
         
         if not events:
-            print("No events found.")
+            lines.append("No events found.")
+            self._write(lines)
             return
         
+        # Stream the blocks, writing one batch per _EVENTS_PER_WRITE events
+        parts = [_render(lines)]
+        for block in self._iter_event_blocks(events, show_attendees):
+            parts.append(block)
+            if len(parts) >= _EVENTS_PER_WRITE:
+                sys.stdout.write("".join(parts))
+                parts.clear()
+        
+        if parts:
+            sys.stdout.write("".join(parts))
+    
+    def _iter_event_blocks(self, events: List, show_attendees: bool):
+        """
+        Yield the numbered display block of each event in a list
+        
+        Args:
+            events (List): List of event objects
+            show_attendees (bool): Whether to show attendee information
+            
+        Yields:
+            str: Rendered block for the next event
+        """
+        summary = self._summary_with_attendees if show_attendees else self._summary_available
         for i, event in enumerate(events, 1):
-            print(f"\n{i}. ", end="")
-            self.display_event_summary(event, show_attendees)
+            yield f"\n{i}. \n{summary(event)}"
     
     def display_user_profile(self, user):
         """
@@ -144,26 +452,18 @@ class UI:
         Args:
             user: User object to display
         """
-        print(f"\n👤 User Profile")
-        print(self.separator)
-        print(f"Name: {user.name}")
-        print(f"Username: {user.username}")
-        print(f"Email: {user.email}")
-        print(f"Role: {user.get_role()}")
-        print(f"Registered Events: {len(user.registered_events)}")
-        
-        # Role-specific information
-        if hasattr(user, 'student_id'):
-            print(f"Student ID: {user.student_id}")
-        elif hasattr(user, 'department'):
-            print(f"Department: {user.department}")
-            if hasattr(user, 'organized_events'):
-                print(f"Organized Events: {len(user.organized_events)}")
-        elif hasattr(user, 'organization') and user.organization:
-            print(f"Organization: {user.organization}")
-        
-        print(f"Member Since: {user.created_at[:10]}")
-        print(self.sub_separator)
+        self._refresh_width()
+        organization = getattr(user, 'organization', None)
+        sys.stdout.write(_profile_template(user).format(
+            user=user,
+            separator=self.separator,
+            sub_separator=self.sub_separator,
+            role=user.get_role(),
+            registered=len(user.registered_events),
+            organized=len(getattr(user, 'organized_events', ())),
+            organization=f"Organization: {organization}\n" if organization else "",
+            member_since=user.created_at[:10],
+        ))
     
     def display_statistics(self, stats: Dict[str, Any], title: str = "Statistics"):
         """
@@ -173,24 +473,25 @@ class UI:
             stats (dict): Statistics dictionary
             title (str): Title for the statistics
         """
-        print(f"\n📊 {title}")
-        print(self.separator)
+        self._refresh_width()
+        lines = [f"\n📊 {title}", self.separator]
         
         for key, value in stats.items():
             # Format key for display
-            display_key = key.replace('_', ' ').title()
+            display_key = _display_key(key)
             
             if isinstance(value, dict):
-                print(f"{display_key}:")
+                lines.append(f"{display_key}:")
                 for sub_key, sub_value in value.items():
-                    sub_display_key = sub_key.replace('_', ' ').title()
-                    print(f"  {sub_display_key}: {sub_value}")
+                    sub_display_key = _display_key(sub_key)
+                    lines.append(f"  {sub_display_key}: {sub_value}")
             elif isinstance(value, float):
-                print(f"{display_key}: {value:.2f}")
+                lines.append(f"{display_key}: {value:.2f}")
             else:
-                print(f"{display_key}: {value}")
+                lines.append(f"{display_key}: {value}")
         
-        print(self.sub_separator)
+        lines.append(self.sub_separator)
+        self._write(lines)
     
     def display_table(self, headers: List[str], rows: List[List], title: str = "Data Table"):
         """
@@ -201,37 +502,39 @@ class UI:
             rows (List[List]): Table rows
             title (str): Table title
         """
-        print(f"\n📋 {title}")
-        print(self.separator)
+        self._refresh_width()
+        lines = [f"\n📋 {title}", self.separator]
         
         if not rows:
-            print("No data to display.")
+            lines.append("No data to display.")
+            self._write(lines)
             return
         
-        # Calculate column widths
+        # Calculate column widths from the transposed cells
+        str_rows = [list(map(str, row)) for row in rows]
+        columns = list(zip_longest(*str_rows, fillvalue=""))
         col_widths = []
         for i, header in enumerate(headers):
-            max_width = len(header)
-            for row in rows:
-                if i < len(row):
-                    max_width = max(max_width, len(str(row[i])))
-            col_widths.append(min(max_width, 20))  # Limit column width
+            column = columns[i] if i < len(columns) else ()
+            col_widths.append(min(max(len(header), max(map(len, column), default=0)), 20))  # Limit column width
         
         # Display headers
         header_row = " | ".join(header.ljust(col_widths[i]) for i, header in enumerate(headers))
-        print(header_row)
-        print("-" * len(header_row))
-        
-        # Display rows
-        for row in rows:
-            formatted_row = []
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    cell_str = str(cell)[:col_widths[i]]  # Truncate if too long
-                    formatted_row.append(cell_str.ljust(col_widths[i]))
-            print(" | ".join(formatted_row))
-        
-        print(self.sub_separator)
+        lines.append(header_row)
+        lines.append(_rule(_DASHES, len(header_row)))
+        
+        # Display rows; each spec's precision truncates cells that are too long
+        cell_specs = [f"{{:<{width}.{width}}}" for width in col_widths]
+        row_formats = {}
+        for row in str_rows:
+            cell_count = min(len(row), len(cell_specs))
+            row_format = row_formats.get(cell_count)
+            if row_format is None:
+                row_format = row_formats[cell_count] = " | ".join(cell_specs[:cell_count])
+            lines.append(row_format.format(*row))
+        
+        lines.append(self.sub_separator)
+        self._write(lines)
     
     def display_success_message(self, message: str):
         """Display success message"""
@@ -249,6 +552,30 @@ class UI:
         """Display info message"""
         print(f"\nℹ️  INFO: {message}")
     
+    def _read_line(self, prompt: str) -> str:
+        """
+        Read one line of input after writing the prompt
+        
+        Interactive terminals go through input() to keep line editing;
+        piped or redirected stdin is read directly with readline().
+        
+        Args:
+            prompt (str): Prompt text
+            
+        Returns:
+            str: Line read, without its trailing newline
+        """
+        stdin = sys.stdin
+        if stdin.isatty():
+            return input(prompt)
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = stdin.readline()
+        if not line:
+            raise EOFError  # Same end-of-input signal as input()
+        return line.rstrip('\n')
+    
     def get_user_input(self, prompt: str, input_type: str = "string") -> str:
         """
         Get user input with validation
@@ -260,9 +587,10 @@ class UI:
         Returns:
             str: User input
         """
+        prompt_text = f"{prompt}: "
         while True:
             try:
-                user_input = input(f"{prompt}: ").strip()
+                user_input = self._read_line(prompt_text).strip()
                 
                 if input_type == "string":
                     return user_input
@@ -293,8 +621,8 @@ class UI:
         Returns:
             bool: True if confirmed
         """
-        response = input(f"{message} (y/N): ").strip().lower()
-        return response in ['y', 'yes']
+        response = self._read_line(f"{message} (y/N): ").strip().lower()
+        return response in _YES_ANSWERS
     
     def display_progress_bar(self, current: int, total: int, prefix: str = "Progress"):
         """
@@ -312,11 +640,20 @@ class UI:
         bar_length = 40
         filled_length = int(bar_length * current // total)
         
-        bar = '█' * filled_length + '-' * (bar_length - filled_length)
-        print(f'\r{prefix}: |{bar}| {percent}% ({current}/{total})', end='', flush=True)
-        
-        if current == total:
-            print()  # New line when complete
+        # Skip redraws that would not change the bar, and throttle the rest;
+        # the final update is always drawn
+        bar_key = (prefix, total, percent, filled_length)
+        now = time.monotonic()
+        if current != total and self._last_progress is not None:
+            last_key, last_drawn = self._last_progress
+            if bar_key == last_key or (last_key[:2] == bar_key[:2] and now - last_drawn < _PROGRESS_INTERVAL):
+                return
+        self._last_progress = (bar_key, now) if current != total else None
+        
+        bar = _rule(_BAR_FILLED, filled_length) + _rule(_DASHES, bar_length - filled_length)
+        end = '\n' if current == total else ''  # New line when complete
+        sys.stdout.write(f'\r{prefix}: |{bar}| {percent}% ({current}/{total}){end}')
+        sys.stdout.flush()
     
     def display_menu_with_options(self, title: str, options: List[str]) -> str:
         """
@@ -329,14 +666,15 @@ class UI:
         Returns:
             str: Selected option number
         """
-        print(f"\n{title}")
-        print("=" * len(title))
+        self._refresh_width()
+        lines = [f"\n{title}", _rule(_EQUALS, len(title))]
         
         for i, option in enumerate(options, 1):
-            print(f"{i}. {option}")
+            lines.append(f"{i}. {option}")
         
-        print(self.sub_separator)
-        return input("Enter your choice: ").strip()
+        lines.append(self.sub_separator)
+        self._write(lines)
+        return self._read_line("Enter your choice: ").strip()
     
     def display_search_results(self, results: List, query: str):
         """
@@ -346,31 +684,64 @@ class UI:
             results (List): Search results
             query (str): Search query
         """
-        print(f"\n🔍 Search Results for: '{query}'")
-        print(self.separator)
+        self._refresh_width()
+        lines = [f"\n🔍 Search Results for: '{query}'", self.separator]
         
         if not results:
-            print("No results found matching your search criteria.")
-            print("\nSuggestions:")
-            print("• Try using different keywords")
-            print("• Check spelling")
-            print("• Use broader search terms")
+            lines.extend([
+                "No results found matching your search criteria.",
+                "\nSuggestions:",
+                "• Try using different keywords",
+                "• Check spelling",
+                "• Use broader search terms",
+            ])
+            self._write(lines)
             return
         
-        print(f"Found {len(results)} result(s):")
-        for i, item in enumerate(results, 1):
-            if hasattr(item, 'name'):  # Event object
-                print(f"\n{i}. 📅 {item.name}")
-                print(f"   Date: {item.date} at {item.time}")
-                print(f"   Location: {item.location}")
-                available = item.capacity - len(item.attendees)
-                print(f"   Available: {available}/{item.capacity} spots")
-            else:  # User object
-                print(f"\n{i}. 👤 {item.name} ({item.username})")
-                print(f"   Role: {item.get_role()}")
-                print(f"   Email: {item.email}")
-        
-        print(self.sub_separator)
+        lines.append(f"Found {len(results)} result(s):")
+        # Results are all of one kind, so pick the renderer from the first item
+        render_hit = self._render_event_hit if hasattr(results[0], 'name') else self._render_user_hit
+        lines.extend(render_hit(i, item) for i, item in enumerate(results, 1))
+        
+        lines.append(self.sub_separator)
+        self._write(lines)
+    
+    def _render_event_hit(self, index: int, event) -> str:
+        """
+        Render one event search result
+        
+        Args:
+            index (int): Result number
+            event: Event object
+            
+        Returns:
+            str: Result lines
+        """
+        capacity = event.capacity
+        available = capacity - len(event.attendees)
+        return (
+            f"\n{index}. 📅 {event.name}\n"
+            f"   Date: {event.date} at {event.time}\n"
+            f"   Location: {event.location}\n"
+            f"   Available: {available}/{capacity} spots"
+        )
+    
+    def _render_user_hit(self, index: int, user) -> str:
+        """
+        Render one user search result
+        
+        Args:
+            index (int): Result number
+            user: User object
+            
+        Returns:
+            str: Result lines
+        """
+        return (
+            f"\n{index}. 👤 {user.name} ({user.username})\n"
+            f"   Role: {user.get_role()}\n"
+            f"   Email: {user.email}"
+        )
     
     def display_loading_message(self, message: str = "Loading..."):
         """Display loading message"""
@@ -387,68 +758,22 @@ class UI:
         Args:
             topic (str): Help topic
         """
-        print(f"\n❓ Help - {topic.title()}")
-        print(self.separator)
-        
-        if topic == "general":
-            print("Campus Event Management System Help")
-            print()
-            print("This system allows you to:")
-            print("• Search for campus events")
-            print("• Register for events")
-            print("• Manage your event registrations")
-            print("• Create and organize events (with proper permissions)")
-            print()
-            print("Navigation:")
-            print("• Use numeric menu choices")
-            print("• Follow prompts for input")
-            print("• Press Ctrl+C to cancel operations")
-            
-        elif topic == "search":
-            print("Event Search Help")
-            print()
-            print("You can search for events by:")
-            print("• Event name (partial matches allowed)")
-            print("• Date (YYYY-MM-DD format)")
-            print("• Location (partial matches allowed)")
-            print()
-            print("Examples:")
-            print("• Search by name: 'conference' finds 'Tech Conference'")
-            print("• Search by date: '2025-08-15'")
-            print("• Search by location: 'hall' finds 'Main Hall'")
-            
-        elif topic == "registration":
-            print("Event Registration Help")
-            print()
-            print("To register for an event:")
-            print("1. Search for events")
-            print("2. Note the Event ID")
-            print("3. Use 'Register for Event' option")
-            print("4. Enter the Event ID")
-            print()
-            print("Notes:")
-            print("• You cannot register for full events")
-            print("• You cannot register for past events")
-            print("• You cannot register twice for the same event")
-            
-        print(self.sub_separator)
+        self._refresh_width()
+        sys.stdout.write(
+            f"\n❓ Help - {topic.title()}\n{self.separator}\n"
+            f"{_HELP_TOPICS.get(topic, '')}{self._sub_separator_line}"
+        )
     
     def display_system_info(self):
         """Display system information"""
-        print(f"\n🖥️  System Information")
-        print(self.separator)
-        print("Campus Event Management System v1.0")
-        print("Developed with Python")
-        print("Features: Role-based access, Event management, Reporting")
-        print(f"Current date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(self.sub_separator)
+        self._refresh_width()
+        current = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        sys.stdout.write(f"{self._system_info_head}Current date: {current}\n{self._sub_separator_line}")
     
     def display_footer(self):
         """Display footer information"""
-        print("\n" + self.sub_separator)
-        print("Campus Event Management System © 2025")
-        print("For support, contact: admin@campus.edu")
-        print(self.sub_separator)
+        self._refresh_width()
+        self._write_static(self._footer)
     
     def pause(self):
         """Pause execution and wait for user input"""
@@ -456,18 +781,18 @@ class UI:
     
     def display_export_success(self, filename: str):
         """Display export success message"""
-        print(f"\n📁 Export successful!")
-        print(f"File saved as: {filename}")
-        print("You can open this file with spreadsheet software.")
+        sys.stdout.write(_EXPORT_SUCCESS_TEMPLATE.format(filename=filename))
     
     def display_import_results(self, results: Dict[str, int]):
         """Display import results"""
-        print(f"\n📥 Import Results")
-        print(self.separator)
-        print(f"✅ Successfully imported: {results.get('success', 0)}")
-        print(f"❌ Failed to import: {results.get('failed', 0)}")
-        print(f"⚠️  Duplicates skipped: {results.get('duplicates', 0)}")
-        print(self.sub_separator)
+        self._refresh_width()
+        sys.stdout.write(_IMPORT_RESULTS_TEMPLATE.format(
+            separator=self.separator,
+            sub_separator=self.sub_separator,
+            success=results.get('success', 0),
+            failed=results.get('failed', 0),
+            duplicates=results.get('duplicates', 0),
+        ))
     
     def display_notification(self, message: str, notification_type: str = "info"):
         """
@@ -497,11 +822,9 @@ class UI:
         Returns:
             str: Formatted datetime
         """
-        try:
-            dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
-        except:
+        if not isinstance(datetime_str, str):
             return datetime_str
+        return _format_datetime(datetime_str)
     
     def truncate_text(self, text: str, max_length: int = 50) -> str:
         """
@@ -535,6 +858,12 @@ class ColorUI(UI):
             'bold': '\033[1m',
             'end': '\033[0m'
         }
+        
+        # Message labels never change, so color them once
+        self._success_label = self.colored_text('✅ SUCCESS:', 'green')
+        self._error_label = self.colored_text('❌ ERROR:', 'red')
+        self._warning_label = self.colored_text('⚠️  WARNING:', 'yellow')
+        self._info_label = self.colored_text('ℹ️  INFO:', 'blue')
     
     def colored_text(self, text: str, color: str) -> str:
         """
@@ -553,19 +882,19 @@ class ColorUI(UI):
     
     def display_success_message(self, message: str):
         """Display colored success message"""
-        print(f"\n{self.colored_text('✅ SUCCESS:', 'green')} {message}")
+        print(f"\n{self._success_label} {message}")
     
     def display_error_message(self, message: str):
         """Display colored error message"""
-        print(f"\n{self.colored_text('❌ ERROR:', 'red')} {message}")
+        print(f"\n{self._error_label} {message}")
     
     def display_warning_message(self, message: str):
         """Display colored warning message"""
-        print(f"\n{self.colored_text('⚠️  WARNING:', 'yellow')} {message}")
+        print(f"\n{self._warning_label} {message}")
     
     def display_info_message(self, message: str):
         """Display colored info message"""
-        print(f"\n{self.colored_text('ℹ️  INFO:', 'blue')} {message}")
+        print(f"\n{self._info_label} {message}")
 
 
 # Utility functions for UI formatting
@@ -577,13 +906,15 @@ def format_percentage(value: float) -> str:
     """Format percentage for display"""
     return f"{value:.1f}%"
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size for display"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, 4)
+    return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
 def create_box(text: str, width: int = 60) -> str:
     """Create a text box around content"""
@@ -591,11 +922,10 @@ def create_box(text: str, width: int = 60) -> str:
     max_line_length = max(len(line) for line in lines) if lines else 0
     box_width = min(max(max_line_length + 4, width), 80)
     
-    box = "┌" + "─" * (box_width - 2) + "┐\n"
-    
-    for line in lines:
-        padding = box_width - len(line) - 4
-        box += f"│ {line}{' ' * padding} │\n"
+    inner_width = box_width - 4
+    rule = _BOX_RULE[:box_width - 2]
     
-    box += "└" + "─" * (box_width - 2) + "┘"
-    return box
\ No newline at end of file
+    box_lines = [f"┌{rule}┐"]
+    box_lines.extend(f"│ {line:<{inner_width}} │" for line in lines)
+    box_lines.append(f"└{rule}┘")
+    return "\n".join(box_lines)
\ No newline at end of file